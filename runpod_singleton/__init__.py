@@ -1,9 +1,23 @@
 """runpod-singleton package."""
 
 from .logger import Logger
-from .singleton import RunpodSingletonManager
 
 __all__ = [
     "Logger",
     "RunpodSingletonManager",
 ]
+
+
+def __getattr__(name):
+    # Resolve the manager lazily so importing the package doesn't pull in the
+    # runpod SDK and YAML stack until it's actually needed.
+    if name == "RunpodSingletonManager":
+        from .singleton import RunpodSingletonManager
+
+        globals()[name] = RunpodSingletonManager
+        return RunpodSingletonManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"RunpodSingletonManager"})
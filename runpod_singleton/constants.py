@@ -1,59 +1,179 @@
 """Constants used across the runpod-singleton package."""
 
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final
+
 # Configuration Keys
-POD_NAME = "pod_name"
-IMAGE_NAME = "image_name"
-GPU_TYPES = "gpu_types"
-CLOUD_TYPE = "cloud_type"
-SUPPORT_PUBLIC_IP = "support_public_ip"
-START_SSH = "start_ssh"
-DATA_CENTER_ID = "data_center_id"
-COUNTRY_CODE = "country_code"
-GPU_COUNT = "gpu_count"
-VOLUME_IN_GB = "volume_in_gb"
-CONTAINER_DISK_IN_GB = "container_disk_in_gb"
-MIN_VCPU_COUNT = "min_vcpu_count"
-MIN_MEMORY_IN_GB = "min_memory_in_gb"
-DOCKER_ARGS = "docker_args"
-PORTS = "ports"
-VOLUME_MOUNT_PATH = "volume_mount_path"
-ENV = "env"
-TEMPLATE_ID = "template_id"
-NETWORK_VOLUME_ID = "network_volume_id"
-ALLOWED_CUDA_VERSIONS = "allowed_cuda_versions"
-MIN_DOWNLOAD = "min_download"
-MIN_UPLOAD = "min_upload"
+POD_NAME: Final[str] = "pod_name"
+IMAGE_NAME: Final[str] = "image_name"
+GPU_TYPES: Final[str] = "gpu_types"
+CLOUD_TYPE: Final[str] = "cloud_type"
+SUPPORT_PUBLIC_IP: Final[str] = "support_public_ip"
+START_SSH: Final[str] = "start_ssh"
+DATA_CENTER_ID: Final[str] = "data_center_id"
+COUNTRY_CODE: Final[str] = "country_code"
+GPU_COUNT: Final[str] = "gpu_count"
+VOLUME_IN_GB: Final[str] = "volume_in_gb"
+CONTAINER_DISK_IN_GB: Final[str] = "container_disk_in_gb"
+MIN_VCPU_COUNT: Final[str] = "min_vcpu_count"
+MIN_MEMORY_IN_GB: Final[str] = "min_memory_in_gb"
+DOCKER_ARGS: Final[str] = "docker_args"
+PORTS: Final[str] = "ports"
+VOLUME_MOUNT_PATH: Final[str] = "volume_mount_path"
+ENV: Final[str] = "env"
+TEMPLATE_ID: Final[str] = "template_id"
+NETWORK_VOLUME_ID: Final[str] = "network_volume_id"
+ALLOWED_CUDA_VERSIONS: Final[str] = "allowed_cuda_versions"
+MIN_DOWNLOAD: Final[str] = "min_download"
+MIN_UPLOAD: Final[str] = "min_upload"
+CREATE_GPU_RETRIES: Final[str] = "create_gpu_retries"
+CREATE_RETRY_WAIT_SECONDS: Final[str] = "create_retry_wait_seconds"
+CREATE_RETRY_MAX_WAIT_SECONDS: Final[str] = "create_retry_max_wait_seconds"
+CREATE_PARALLELISM: Final[str] = "create_parallelism"
+VALIDATE_POLL_TIMEOUT_SECONDS: Final[str] = "validate_poll_timeout_seconds"
+VALIDATE_POLL_INITIAL_SECONDS: Final[str] = "validate_poll_initial_seconds"
+CLEANUP_CONCURRENCY: Final[str] = "cleanup_concurrency"
+PODS_CACHE_TTL_SECONDS: Final[str] = "pods_cache_ttl_seconds"
 
 # Runpod API Response Keys / Values
-POD_ID = "id"
-POD_STATUS = "desiredStatus"
-POD_MACHINE = "machine"
-POD_GPU_DISPLAY_NAME = "gpuDisplayName"
-POD_GPU_COUNT = "gpuCount"
-POD_NAME_API = "name"
-POD_STATUS_RUNNING = "RUNNING"
-POD_STATUS_EXITED = "EXITED"
+POD_ID: Final[str] = "id"
+POD_STATUS: Final[str] = "desiredStatus"
+POD_MACHINE: Final[str] = "machine"
+POD_GPU_DISPLAY_NAME: Final[str] = "gpuDisplayName"
+POD_GPU_COUNT: Final[str] = "gpuCount"
+POD_NAME_API: Final[str] = "name"
+POD_STATUS_RUNNING: Final[str] = "RUNNING"
+POD_STATUS_EXITED: Final[str] = "EXITED"
+POD_STATUS_CREATED: Final[str] = "CREATED"
+POD_STATUS_RESTARTING: Final[str] = "RESTARTING"
+POD_STATUS_TERMINATED: Final[str] = "TERMINATED"
+
+# Minimal GraphQL query for listing pods, requesting only the fields we read
+GRAPHQL_PODS_QUERY: Final[str] = "query { myself { pods { id name desiredStatus } } }"
+# GraphQL error raised when the API schema no longer has a queried field
+GRAPHQL_FIELD_ERROR_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\bcannot query field\b", re.IGNORECASE
+)
 
 # Default Values
-DEFAULT_CLOUD_TYPE = "ALL"
-DEFAULT_SUPPORT_PUBLIC_IP = True
-DEFAULT_START_SSH = True
-DEFAULT_GPU_COUNT = 1
-DEFAULT_VOLUME_IN_GB = 0
-DEFAULT_MIN_VCPU_COUNT = 1
-DEFAULT_MIN_MEMORY_IN_GB = 1
-DEFAULT_DOCKER_ARGS = ""
-DEFAULT_VOLUME_MOUNT_PATH = "/runpod-volume"
+DEFAULT_CLOUD_TYPE: Final[str] = "ALL"
+DEFAULT_SUPPORT_PUBLIC_IP: Final[bool] = True
+DEFAULT_START_SSH: Final[bool] = True
+DEFAULT_GPU_COUNT: Final[int] = 1
+DEFAULT_VOLUME_IN_GB: Final[int] = 0
+DEFAULT_MIN_VCPU_COUNT: Final[int] = 1
+DEFAULT_MIN_MEMORY_IN_GB: Final[int] = 1
+DEFAULT_DOCKER_ARGS: Final[str] = ""
+DEFAULT_VOLUME_MOUNT_PATH: Final[str] = "/runpod-volume"
+
+# Read-only mapping of optional config keys to their default values
+DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType({
+    CLOUD_TYPE: DEFAULT_CLOUD_TYPE,
+    SUPPORT_PUBLIC_IP: DEFAULT_SUPPORT_PUBLIC_IP,
+    START_SSH: DEFAULT_START_SSH,
+    GPU_COUNT: DEFAULT_GPU_COUNT,
+    VOLUME_IN_GB: DEFAULT_VOLUME_IN_GB,
+    MIN_VCPU_COUNT: DEFAULT_MIN_VCPU_COUNT,
+    MIN_MEMORY_IN_GB: DEFAULT_MIN_MEMORY_IN_GB,
+    DOCKER_ARGS: DEFAULT_DOCKER_ARGS,
+    VOLUME_MOUNT_PATH: DEFAULT_VOLUME_MOUNT_PATH,
+})
 
 # Exit Codes
-EXIT_SUCCESS = 0
-EXIT_FAILURE = 1
-EXIT_INTERRUPTED = 130
+EXIT_SUCCESS: Final[int] = 0
+EXIT_FAILURE: Final[int] = 1
+EXIT_INTERRUPTED: Final[int] = 130
 
 # Retry values
-DEFAULT_CREATE_GPU_RETRIES = 1
-DEFAULT_CREATE_RETRY_WAIT_SECONDS = 10
+DEFAULT_CREATE_GPU_RETRIES: Final[int] = 1
+DEFAULT_CREATE_RETRY_WAIT_SECONDS: Final[int] = 10
+DEFAULT_CREATE_RETRY_MAX_WAIT_SECONDS: Final[int] = 120
+CREATE_RETRY_BACKOFF_FACTOR: Final[float] = 1.5
+CREATE_RETRY_JITTER_FRACTION: Final[float] = 0.1
+DEFAULT_CREATE_PARALLELISM: Final[int] = 1
+
+# API call retry values
+API_RETRIES: Final[int] = 5
+API_RETRY_BASE_SECONDS: Final[float] = 0.5
+API_RETRY_FACTOR: Final[float] = 2.0
+API_RETRY_MAX_DELAY_SECONDS: Final[float] = 30.0
+API_RETRY_JITTER_SECONDS: Final[float] = 0.2
+# HTTP statuses that will never succeed on retry
+API_NON_RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({401, 403})
+# HTTP status indicating the request was rejected before being processed,
+# so even non-idempotent calls are safe to retry
+API_RATE_LIMIT_STATUS: Final[int] = 429
+# HTTP statuses indicating the API is overloaded
+API_SERVER_ERROR_STATUSES: Final[frozenset[int]] = frozenset({500, 502, 503, 504})
+# Error message patterns used when no HTTP status is available. Word
+# boundaries keep digits inside pod IDs or other values from matching.
+API_NON_RETRYABLE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\bnot enough free gpus\b"
+    r"|\bno longer any instances available\b"
+    r"|\bgpu type (?:is )?not available\b"
+    r"|\bunauthorized\b"
+    r"|\bno api key\b",
+    re.IGNORECASE,
+)
+API_RATE_LIMIT_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\b429\b|\brate[ -]?limit|\btoo many requests\b",
+    re.IGNORECASE,
+)
+API_SERVER_ERROR_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\binternal[_ ]server[_ ]error\b|\b50[234]\b",
+    re.IGNORECASE,
+)
+# Error kinds returned by the API client's error classifier
+API_ERROR_NON_RETRYABLE: Final[str] = "non_retryable"
+API_ERROR_RATE_LIMIT: Final[str] = "rate_limit"
+API_ERROR_SERVER: Final[str] = "server"
+API_ERROR_TRANSIENT: Final[str] = "transient"
+
+# HTTP connection pool values
+HTTP_POOL_CONNECTIONS: Final[int] = 4
+HTTP_POOL_MAXSIZE: Final[int] = 16
+
+# Rate limiter values
+RATE_LIMIT_RPM: Final[int] = 60
+RATE_LIMIT_WINDOW_SECONDS: Final[float] = 60.0
+RATE_LIMIT_MAX_CONCURRENCY: Final[int] = 5
+RATE_LIMIT_INCREASE_STEP: Final[float] = 1.0
+RATE_LIMIT_DECREASE_FACTOR: Final[float] = 0.5
+
+# Validation polling values
+DEFAULT_VALIDATE_POLL_TIMEOUT_SECONDS: Final[int] = 30
+DEFAULT_VALIDATE_POLL_INITIAL_SECONDS: Final[int] = 1
+VALIDATE_POLL_BACKOFF_FACTOR: Final[int] = 2
+VALIDATE_POLL_MAX_DELAY_SECONDS: Final[int] = 15
+
+# Cleanup values
+DEFAULT_CLEANUP_CONCURRENCY: Final[int] = 8
+
+# Caching values
+DEFAULT_PODS_CACHE_TTL_SECONDS: Final[int] = 5
+# Cross-invocation pod list cache file in the temp dir, disabled by default
+DEFAULT_PODS_FILE_CACHE_TTL_SECONDS: Final[float] = 0.0
+# Per-user cache directory in the temp dir (suffixed with the user ID), and
+# the name prefix of the per-API-key files inside it
+PODS_FILE_CACHE_DIR_PREFIX: Final[str] = "runpod-singleton-"
+PODS_FILE_CACHE_PREFIX: Final[str] = "pods-"
+
+# Read-only mapping of runtime setting keys to their default values
+SETTINGS_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType({
+    CREATE_GPU_RETRIES: DEFAULT_CREATE_GPU_RETRIES,
+    CREATE_RETRY_WAIT_SECONDS: DEFAULT_CREATE_RETRY_WAIT_SECONDS,
+    CREATE_RETRY_MAX_WAIT_SECONDS: DEFAULT_CREATE_RETRY_MAX_WAIT_SECONDS,
+    CREATE_PARALLELISM: DEFAULT_CREATE_PARALLELISM,
+    VALIDATE_POLL_TIMEOUT_SECONDS: DEFAULT_VALIDATE_POLL_TIMEOUT_SECONDS,
+    VALIDATE_POLL_INITIAL_SECONDS: DEFAULT_VALIDATE_POLL_INITIAL_SECONDS,
+    CLEANUP_CONCURRENCY: DEFAULT_CLEANUP_CONCURRENCY,
+    PODS_CACHE_TTL_SECONDS: DEFAULT_PODS_CACHE_TTL_SECONDS,
+})
 
 # Callback Server Defaults
-DEFAULT_TEST_CALLBACK_HOST = "127.0.0.1"
-DEFAULT_TEST_CALLBACK_PORT = 8080
+DEFAULT_TEST_CALLBACK_HOST: Final[str] = "127.0.0.1"
+DEFAULT_TEST_CALLBACK_PORT: Final[int] = 8080
@@ -0,0 +1,98 @@
+"""Client-side rate limiting for RunPod API calls."""
+
+import threading
+import time
+from collections import deque
+
+from . import constants as const
+
+
+class RateLimiter:
+    """
+    Paces API calls using a sliding-window request budget plus an AIMD
+    (additive-increase, multiplicative-decrease) cap on in-flight calls.
+
+    Callers must pair each `acquire()` with exactly one of `on_success()`,
+    `on_rate_limited()` or `on_failure()`.
+    """
+
+    def __init__(
+        self,
+        rpm: int = const.RATE_LIMIT_RPM,
+        max_concurrency: int = const.RATE_LIMIT_MAX_CONCURRENCY,
+        window_seconds: float = const.RATE_LIMIT_WINDOW_SECONDS,
+        increase_step: float = const.RATE_LIMIT_INCREASE_STEP,
+        decrease_factor: float = const.RATE_LIMIT_DECREASE_FACTOR,
+    ):
+        """
+        Initializes the RateLimiter.
+
+        :param rpm: Maximum number of calls started per window.
+        :type rpm: int
+        :param max_concurrency: Upper bound for the number of in-flight calls.
+        :type max_concurrency: int
+        :param window_seconds: Length of the sliding window for `rpm`.
+        :type window_seconds: float
+        :param increase_step: Amount the in-flight cap grows by after a success.
+        :type increase_step: float
+        :param decrease_factor: Factor the in-flight cap is multiplied by after a rate-limit error.
+        :type decrease_factor: float
+        """
+        self.rpm: int = rpm
+        self.max_concurrency: int = max_concurrency
+        self.window_seconds: float = window_seconds
+        self.increase_step: float = increase_step
+        self.decrease_factor: float = decrease_factor
+        self.max_in_flight: float = float(max_concurrency)
+        self.in_flight: int = 0
+        self._started: deque[float] = deque()
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """
+        Blocks until a call may be started under both the window budget and
+        the current in-flight cap, then reserves a slot for it.
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._started and now - self._started[0] >= self.window_seconds:
+                    self._started.popleft()
+                if self.in_flight >= max(1, int(self.max_in_flight)):
+                    self._cond.wait()
+                elif len(self._started) >= self.rpm:
+                    self._cond.wait(self._started[0] + self.window_seconds - now)
+                else:
+                    break
+            self._started.append(now)
+            self.in_flight += 1
+
+    def on_success(self) -> None:
+        """
+        Releases a slot after a successful call and additively raises the in-flight cap.
+        """
+        with self._cond:
+            self.max_in_flight = min(
+                float(self.max_concurrency), self.max_in_flight + self.increase_step
+            )
+            self._release()
+
+    def on_rate_limited(self) -> None:
+        """
+        Releases a slot after a rate-limit/overload error and multiplicatively
+        lowers the in-flight cap (never below one call).
+        """
+        with self._cond:
+            self.max_in_flight = max(1.0, self.max_in_flight * self.decrease_factor)
+            self._release()
+
+    def on_failure(self) -> None:
+        """
+        Releases a slot after a call failed for reasons unrelated to load.
+        """
+        with self._cond:
+            self._release()
+
+    def _release(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+        self._cond.notify_all()
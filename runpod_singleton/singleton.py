@@ -10,44 +10,484 @@ If the pod doesn't exist, it attempts to create one using a prioritized list of
 
 import os
 import sys
+import json
 import yaml
 import time
-import pprint
-import runpod
+import random
+import requests
 import argparse
 import logging
+import stat
+import getpass
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping
 
 from pyaml_env import parse_config
+from requests.adapters import HTTPAdapter
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 from .logger import Logger
+from .rate_limiter import RateLimiter
 from . import constants as const
 
+if TYPE_CHECKING:
+    import runpod
+
+
+def _import_runpod() -> None:
+    """
+    Imports the runpod SDK into this module's namespace on first use.
+
+    The SDK takes over a second to import, so it is deferred until an API
+    client is created; `--help` and argument errors don't pay for it.
+    """
+    global runpod
+    if "runpod" not in globals():
+        import runpod
+
+
+def __getattr__(name: str) -> Any:
+    if name == "runpod":
+        _import_runpod()
+        return globals()["runpod"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class RunpodApiError(Exception):
+    """
+    Raised by RunpodApiClient when a RunPod API call fails after retries.
+    """
+
+
+def _is_field_query_error(error: BaseException | None) -> bool:
+    """
+    Checks whether an error is the SDK's GraphQL error for a queried field
+    the API schema does not have.
+
+    :param error: The error to check.
+    :type error: BaseException | None
+    :return: True if `error` is a QueryError about a queried field.
+    :rtype: bool
+    """
+    return isinstance(error, runpod.error.QueryError) and bool(
+        const.GRAPHQL_FIELD_ERROR_PATTERN.search(str(error))
+    )
+
+
+# Refuses to follow a symlink at the final path component, where supported
+_O_NOFOLLOW: int = getattr(os, "O_NOFOLLOW", 0)
+
+
+def _current_uid() -> int | str:
+    """
+    Returns an identifier for the current local user.
+
+    :return: The numeric user ID, or the login name on platforms without one.
+    :rtype: int | str
+    """
+    return os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+
+
+def _owned_by_current_user(st: os.stat_result) -> bool:
+    """
+    Checks whether a file is owned by the current user.
+
+    :param st: The file's stat result.
+    :type st: os.stat_result
+    :return: True if owned by the current user, or if ownership can't be checked.
+    :rtype: bool
+    """
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+class _SessionTransport:
+    """
+    Stand-in for the `requests` module inside the runpod SDK that sends POSTs
+    through a shared, connection-pooling session.
+
+    Rate-limit and server error responses are raised as `requests.HTTPError`,
+    so the retry logic sees their status instead of the SDK's failure to
+    decode the response body.
+    """
+    def __init__(self, session: requests.Session):
+        self._session: requests.Session = session
+
+    def post(self, *args: Any, **kwargs: Any) -> requests.Response:
+        response = self._session.post(*args, **kwargs)
+        if (
+            response.status_code == const.API_RATE_LIMIT_STATUS
+            or response.status_code in const.API_SERVER_ERROR_STATUSES
+        ):
+            response.raise_for_status()
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
 
 class RunpodApiClient:
     """
     Facade/Wrapper for runpod SDK interactions. Isolates the external dependency.
     """
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        pods_file_cache_ttl: float = const.DEFAULT_PODS_FILE_CACHE_TTL_SECONDS,
+    ):
         """
         Initializes the API client and sets the RunPod API key.
 
         :param api_key: The RunPod API key.
         :type api_key: str
+        :param pods_file_cache_ttl: Seconds a pod listing stays valid in the on-disk cache
+            shared between invocations; 0 disables it.
+        :type pods_file_cache_ttl: float
         """
+        _import_runpod()
         self.api_key: str = api_key
         runpod.api_key = self.api_key
+        self.pods_file_cache_ttl: float = pods_file_cache_ttl
+        # A private directory per local user, so other users can't plant listings
+        self._pods_cache_dir: Path = Path(tempfile.gettempdir()) / (
+            f"{const.PODS_FILE_CACHE_DIR_PREFIX}{_current_uid()}"
+        )
+        # One cache file per API key, so different accounts never share listings
+        key_digest = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self._pods_cache_path: Path = self._pods_cache_dir / (
+            f"{const.PODS_FILE_CACHE_PREFIX}{key_digest}.json"
+        )
+        # Its mtime records the last pod state change by any invocation
+        self._pods_invalidated_path: Path = self._pods_cache_path.with_suffix(".invalidated")
+        self.rate_limiter: RateLimiter = RateLimiter()
+        self._session: requests.Session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Creates a keep-alive HTTP session and routes the runpod SDK's GraphQL
+        requests through it, so TCP/TLS setup is paid once per run instead of
+        once per call.
+
+        The SDK has no transport hook, so its module-level `requests` reference
+        is replaced. This patch is process-wide: the most recently created
+        client's session carries every SDK request, including those of other
+        clients. Retries stay in `_retry`, not in the adapter.
+
+        :return: The configured session.
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=const.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=const.HTTP_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self._transport: _SessionTransport = _SessionTransport(session)
+        runpod.api.graphql.requests = self._transport
+        return session
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP session and restores the runpod SDK's own
+        `requests` transport, unless another client's session has since been
+        installed in its place.
+        """
+        if runpod.api.graphql.requests is self._transport:
+            runpod.api.graphql.requests = requests
+        self._session.close()
+
+    @staticmethod
+    def _classify_error(error: Exception) -> str:
+        """
+        Classifies an error raised by an SDK call for the retry logic.
+
+        The SDK's authentication error and the HTTP status of a
+        `requests.HTTPError` are used when present. Other errors are matched
+        against the const.API_*_PATTERN regexes, as the SDK raises the same
+        QueryError for every GraphQL failure.
+
+        :param error: The network, HTTP or SDK error raised by the SDK call.
+        :type error: Exception
+        :return: One of the const.API_ERROR_* kinds.
+        :rtype: str
+        """
+        if isinstance(error, runpod.error.AuthenticationError) or _is_field_query_error(error):
+            return const.API_ERROR_NON_RETRYABLE
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        if status == const.API_RATE_LIMIT_STATUS:
+            return const.API_ERROR_RATE_LIMIT
+        if status in const.API_SERVER_ERROR_STATUSES:
+            return const.API_ERROR_SERVER
+        if status in const.API_NON_RETRYABLE_STATUSES:
+            return const.API_ERROR_NON_RETRYABLE
+        message = str(error)
+        if const.API_NON_RETRYABLE_PATTERN.search(message):
+            return const.API_ERROR_NON_RETRYABLE
+        if const.API_RATE_LIMIT_PATTERN.search(message):
+            return const.API_ERROR_RATE_LIMIT
+        if const.API_SERVER_ERROR_PATTERN.search(message):
+            return const.API_ERROR_SERVER
+        return const.API_ERROR_TRANSIENT
+
+    def _retry(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        idempotent: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Calls an SDK function, retrying transient failures with exponential backoff.
+
+        Only network/HTTP errors (`requests.RequestException`) and runpod SDK
+        errors are treated as API failures; any other exception is re-raised
+        as is, without retrying. API failures classified as non-retryable by
+        `_classify_error()` (e.g. no free GPUs, bad API key) are raised
+        immediately. Other errors are retried up to
+        const.API_RETRIES times, sleeping `base * factor**attempt` seconds (capped,
+        plus random jitter) between attempts. Non-idempotent calls are only retried
+        on rate-limit errors, since the request was then rejected before being
+        processed.
+
+        Every attempt is paced by `self.rate_limiter`; rate-limit and server
+        errors shrink its in-flight cap, successes grow it back.
+
+        :param fn: The SDK function to call.
+        :type fn: Callable[..., Any]
+        :param args: Positional arguments for `fn`.
+        :param idempotent: Whether it is safe to repeat the call after a generic failure.
+        :type idempotent: bool
+        :param kwargs: Keyword arguments for `fn`.
+        :return: The return value of `fn`.
+        :rtype: Any
+        :raises RunpodApiError: Wrapping the last API error raised by `fn` if it is not retryable or retries are exhausted.
+        """
+        for attempt in range(const.API_RETRIES + 1):
+            self.rate_limiter.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not isinstance(e, (requests.RequestException, runpod.error.RunPodError)):
+                    # Not an API failure, e.g. a bug or bad input; retrying would only hide it
+                    self.rate_limiter.on_failure()
+                    raise
+                kind = self._classify_error(e)
+                if kind in (const.API_ERROR_RATE_LIMIT, const.API_ERROR_SERVER):
+                    self.rate_limiter.on_rate_limited()
+                else:
+                    self.rate_limiter.on_failure()
+                if attempt == const.API_RETRIES or kind == const.API_ERROR_NON_RETRYABLE:
+                    raise RunpodApiError(str(e)) from e
+                if not idempotent and kind != const.API_ERROR_RATE_LIMIT:
+                    raise RunpodApiError(str(e)) from e
+                delay = min(
+                    const.API_RETRY_BASE_SECONDS * const.API_RETRY_FACTOR**attempt,
+                    const.API_RETRY_MAX_DELAY_SECONDS,
+                )
+                time.sleep(delay + random.uniform(0, const.API_RETRY_JITTER_SECONDS))
+            else:
+                self.rate_limiter.on_success()
+                return result
+
+    def _gql(self, query: str) -> dict[str, Any]:
+        """
+        Runs a raw GraphQL query through the runpod SDK's transport.
+
+        :param query: The GraphQL query string.
+        :type query: str
+        :return: The decoded JSON response.
+        :rtype: dict[str, Any]
+        :raises runpod.error.QueryError: If the API returns GraphQL errors.
+        """
+        return runpod.api.graphql.run_graphql_query(query, api_key=self.api_key)
 
     def get_pods(self) -> list[dict[str, Any]]:
         """
         Retrieves a list of all pods for the current user.
 
+        Only the fields used by this package (ID, name, status) are requested.
+        Falls back to the SDK's full pod listing if the API rejects a queried
+        field or the response has an unexpected shape; other failures, such as
+        exhausted retries or a bad API key, are raised. When
+        `pods_file_cache_ttl` is set, a listing fetched by an earlier invocation
+        within that many seconds is reused instead.
+
         :return: A list of pod dictionaries.
         :rtype: list[dict[str, Any]]
+        :raises RunpodApiError: If the API call fails.
+        """
+        if self.pods_file_cache_ttl > 0:
+            cached = self._read_pods_cache()
+            if cached is not None:
+                return cached
+            # Created before querying, so changes made while the query runs are recorded
+            self._pods_cache_dir_ok(create=True)
+        # Stamped before querying, so a change made while the query runs
+        # always postdates the listing
+        fetched_at = time.time()
+        try:
+            response = self._retry(self._gql, const.GRAPHQL_PODS_QUERY)
+            pods = response["data"]["myself"]["pods"]
+        except (RunpodApiError, KeyError, TypeError) as e:
+            if isinstance(e, RunpodApiError) and not _is_field_query_error(e.__cause__):
+                raise
+            # NOTE: get_pods() has a bad return signature, thus the linter ignore below.
+            pods = self._retry(runpod.get_pods)  # pyright: ignore[reportReturnType]
+        if self.pods_file_cache_ttl > 0:
+            self._write_pods_cache(pods, fetched_at)
+        return pods
+
+    def _pods_cache_dir_ok(self, create: bool = False) -> bool:
+        """
+        Checks that the on-disk cache directory is a real directory owned by
+        the current user and closed to everyone else.
+
+        :param create: Whether to create the directory, with mode 0700, if missing.
+        :type create: bool
+        :return: True if the directory can be trusted.
+        :rtype: bool
+        """
+        try:
+            if create:
+                try:
+                    os.mkdir(self._pods_cache_dir, 0o700)
+                except FileExistsError:
+                    pass
+            st = os.lstat(self._pods_cache_dir)
+        except OSError:
+            return False
+        return (
+            stat.S_ISDIR(st.st_mode)
+            and _owned_by_current_user(st)
+            and not st.st_mode & 0o077
+        )
+
+    def _read_pods_cache(self) -> list[dict[str, Any]] | None:
+        """
+        Reads the on-disk pod listing if it is younger than `pods_file_cache_ttl`
+        and no pod state change was made since it was fetched.
+
+        Files not owned by the current user are ignored.
+
+        :return: The cached pods, or None if the cache is missing, stale or unreadable.
+        :rtype: list[dict[str, Any]] | None
+        """
+        if not self._pods_cache_dir_ok():
+            return None
+        try:
+            fd = os.open(self._pods_cache_path, os.O_RDONLY | _O_NOFOLLOW)
+            with os.fdopen(fd, "rb") as f:
+                if not _owned_by_current_user(os.fstat(f.fileno())):
+                    return None
+                cache = json.loads(f.read())
+            fetched_at = cache["fetched_at"]
+            if (
+                time.time() - fetched_at < self.pods_file_cache_ttl
+                and fetched_at > self._pods_invalidated_at()
+            ):
+                return cache["pods"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_pods_cache(self, pods: list[dict[str, Any]], fetched_at: float) -> None:
+        """
+        Atomically writes the pod listing to the on-disk cache, stamped with
+        the time the query started.
+
+        Only the ID, name and status of each pod are stored, so the full SDK
+        listing's environment variables never reach the disk. Nothing is
+        written if pod state changed after the query started.
+
+        :param pods: The pods returned by the API.
+        :type pods: list[dict[str, Any]]
+        :param fetched_at: The `time.time()` at which the query started.
+        :type fetched_at: float
+        """
+        if not self._pods_cache_dir_ok(create=True) or fetched_at <= self._pods_invalidated_at():
+            return
+        fields = (const.POD_ID, const.POD_NAME_API, const.POD_STATUS)
+        cache = {
+            "fetched_at": fetched_at,
+            "pods": [{field: pod.get(field) for field in fields} for pod in pods],
+        }
+        tmp_path = self._pods_cache_path.with_name(
+            f"{self._pods_cache_path.name}.{os.getpid()}.{threading.get_ident()}"
+        )
+        try:
+            fd = os.open(
+                tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_NOFOLLOW, 0o600
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self._pods_cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _pods_invalidated_at(self) -> float:
         """
-        # NOTE: get_pods() has a bad return signature, thus the linter ignore below.
-        return runpod.get_pods()  # pyright: ignore[reportReturnType]
+        Returns when any invocation last changed pod state.
+
+        :return: The invalidation marker's mtime, or 0.0 if there is none.
+        :rtype: float
+        """
+        try:
+            return self._pods_invalidated_path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _invalidate_pods_cache(self) -> None:
+        """
+        Removes the on-disk pod listing and records the time of the change, so
+        a listing fetched before it is never written back or reused.
+
+        Runs whatever this client's `pods_file_cache_ttl` is, as other invocations
+        may still read the cache, but only once some invocation has created
+        the cache directory; nothing is written otherwise.
+        """
+        if not self._pods_cache_dir_ok():
+            return
+        now = time.time()
+        try:
+            fd = os.open(
+                self._pods_invalidated_path, os.O_WRONLY | os.O_CREAT | _O_NOFOLLOW, 0o600
+            )
+            os.close(fd)
+            os.utime(self._pods_invalidated_path, (now, now))
+            self._pods_cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _retry_state_change(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls `_retry()` for a call that changes pod state, invalidating the
+        on-disk pod listing both before and after it.
+
+        :param fn: The SDK function to call.
+        :type fn: Callable[..., Any]
+        :param args: Positional arguments for `_retry()`.
+        :param kwargs: Keyword arguments for `_retry()`.
+        :return: The return value of `fn`.
+        :rtype: Any
+        :raises RunpodApiError: If the call fails.
+        """
+        self._invalidate_pods_cache()
+        try:
+            return self._retry(fn, *args, **kwargs)
+        finally:
+            self._invalidate_pods_cache()
 
     def get_pod(self, pod_id: str) -> dict[str, Any]:
         """
@@ -58,19 +498,20 @@ class RunpodApiClient:
         :return: A dictionary containing pod details.
         :rtype: dict[str, Any]
         """
-        return runpod.get_pod(pod_id)
+        return self._retry(runpod.get_pod, pod_id)
 
     def create_pod(self, **kwargs: Any) -> dict[str, Any]:
         """
         Creates a new pod with the specified configuration.
 
         Accepts keyword arguments corresponding to the parameters of runpod.create_pod.
+        As creation is not idempotent, only rate-limit errors are retried.
 
         :param kwargs: Pod configuration parameters.
         :return: A dictionary containing the response from the RunPod API.
         :rtype: dict[str, Any]
         """
-        return runpod.create_pod(**kwargs)
+        return self._retry_state_change(runpod.create_pod, idempotent=False, **kwargs)
 
     def resume_pod(self, pod_id: str, gpu_count: int = 1) -> dict[str, Any]:
         """
@@ -83,7 +524,7 @@ class RunpodApiClient:
         :return: A dictionary containing the response from the RunPod API.
         :rtype: dict[str, Any]
         """
-        return runpod.resume_pod(pod_id, gpu_count=gpu_count)
+        return self._retry_state_change(runpod.resume_pod, pod_id, gpu_count=gpu_count)
 
     def stop_pod(self, pod_id: str) -> dict[str, Any]:
         """
@@ -94,7 +535,7 @@ class RunpodApiClient:
         :return: A dictionary containing the response from the RunPod API.
         :rtype: dict[str, Any]
         """
-        return runpod.stop_pod(pod_id)
+        return self._retry_state_change(runpod.stop_pod, pod_id)
 
     def terminate_pod(self, pod_id: str) -> dict[str, Any]:
         """
@@ -106,7 +547,7 @@ class RunpodApiClient:
         :rtype: dict[str, Any]
         """
         # NOTE: terminate_pod() has a bad return signature, thus the linter ignore below.
-        return runpod.terminate_pod(pod_id)  # pyright: ignore[reportReturnType]
+        return self._retry_state_change(runpod.terminate_pod, pod_id)  # pyright: ignore[reportReturnType]
 
 
 class PodLifecycleManager:
@@ -143,10 +584,45 @@ class PodLifecycleManager:
         self.stop: bool = stop
         self.terminate: bool = terminate
         self.pod_name: str = config[const.POD_NAME]
+        # Names a listed pod must carry to count as ours
+        self.pod_names: frozenset[str] = frozenset((self.pod_name,))
         self.gpu_types: list[str] = config.get(const.GPU_TYPES, [])
+        # Runtime settings with their defaults applied; the attributes below
+        # are the only copy, so create calls always see their current values
+        settings = {
+            key: config.get(key, default) for key, default in const.SETTINGS_DEFAULTS.items()
+        }
         self.gpu_count: int = config.get(const.GPU_COUNT, const.DEFAULT_GPU_COUNT)
-        self.create_retries: int = config.get("create_gpu_retries", const.DEFAULT_CREATE_GPU_RETRIES)
-        self.create_wait: int = config.get("create_retry_wait_seconds", const.DEFAULT_CREATE_RETRY_WAIT_SECONDS)
+        self.create_retries: int = settings[const.CREATE_GPU_RETRIES]
+        self.create_wait: int = settings[const.CREATE_RETRY_WAIT_SECONDS]
+        self.create_max_wait: int = settings[const.CREATE_RETRY_MAX_WAIT_SECONDS]
+        self.validate_poll_timeout: float = settings[const.VALIDATE_POLL_TIMEOUT_SECONDS]
+        self.validate_poll_initial: float = settings[const.VALIDATE_POLL_INITIAL_SECONDS]
+        self.create_parallelism: int = settings[const.CREATE_PARALLELISM]
+        self.cleanup_concurrency: int = settings[const.CLEANUP_CONCURRENCY]
+        self.pods_cache_ttl: float = settings[const.PODS_CACHE_TTL_SECONDS]
+        # Existing pod status -> handler; unknown statuses fall back to resuming
+        self._status_handlers: dict[str, Callable[[str], str | None]] = {
+            const.POD_STATUS_RUNNING: self._already_running,
+            const.POD_STATUS_CREATED: self._wait_for_running,
+            const.POD_STATUS_RESTARTING: self._wait_for_running,
+            const.POD_STATUS_EXITED: self._resume_then_validate,
+            const.POD_STATUS_TERMINATED: self._skip_terminated,
+        }
+        self._pods_cache: list[dict[str, Any]] | None = None
+        self._pods_cache_time: float = 0.0
+
+    def set_cleanup_flags(self, stop: bool, terminate: bool) -> None:
+        """
+        Updates which actions perform_cleanup_actions() will take.
+
+        :param stop: Flag indicating if stop actions should be performed.
+        :type stop: bool
+        :param terminate: Flag indicating if terminate actions should be performed.
+        :type terminate: bool
+        """
+        self.stop = stop
+        self.terminate = terminate
 
     def manage(self) -> str | None:
         """
@@ -168,14 +644,14 @@ class PodLifecycleManager:
         if existing_pod_result:
             pod_id = self._handle_existing_pod(existing_pod_result)
             if pod_id:
-                self.log.info(f"Existing pod {pod_id} is running and valid.")
+                self.log.info("Existing pod %s is running and valid.", pod_id)
                 return pod_id
             else:
                 self.log.warning(
                     "Handling existing pod failed. Attempting to create a new one."
                 )
         else:
-            self.log.info(f"No existing pod found with name '{self.pod_name}'.")
+            self.log.info("No existing pod found with name '%s'.", self.pod_name)
 
         return self._attempt_new_pod_creation()
 
@@ -191,81 +667,141 @@ class PodLifecycleManager:
                  Note: API call success/failure is logged within this method.
         :rtype: bool | None
         """
+        if not (self.stop or self.terminate):
+            self.log.debug("No cleanup flags set; skipping cleanup actions.")
+            return True
+
         self.log.info("Starting cleanup actions...")
-        matching_pods = self.find_all_pods_by_name()
+        partitioned_pods = self.find_pods_by_name_partitioned()
 
         # Check if the API call failed
-        if matching_pods is None:
+        if partitioned_pods is None:
             self.log.error("API call to get pods failed. Cannot perform cleanup actions.")
             return None
 
+        matching_pods = partitioned_pods["all_matching"]
+
         if not matching_pods:
             self.log.info("No pods found matching the name. No cleanup actions needed.")
             return True
 
         if self.stop:
-            self.log.info(f"Processing stop action for pod name '{self.pod_name}'.")
-            running_pods_to_stop = [
-                pod
-                for pod in matching_pods
-                if pod.get(const.POD_STATUS) == const.POD_STATUS_RUNNING
-            ]
+            self.log.info("Processing stop action for pod name '%s'.", self.pod_name)
+            running_pods_to_stop = partitioned_pods["running"]
             if running_pods_to_stop:
                 self.log.info(
-                    f"Found {len(running_pods_to_stop)} running pods to stop."
+                    "Found %s running pods to stop.", len(running_pods_to_stop)
+                )
+                self._run_pod_actions(
+                    self.client.stop_pod,
+                    [pod[const.POD_ID] for pod in running_pods_to_stop],
+                    "stop",
+                    "stopping",
                 )
-                for pod in running_pods_to_stop:
-                    pod_id = pod[const.POD_ID]
-                    try:
-                        self.log.debug(f"Attempting to stop pod {pod_id}...")
-                        response = self.client.stop_pod(pod_id)
-                        if self.log.isEnabledFor(logging.DEBUG):
-                            self.log.debug(f"Stop API response for {pod_id}:")
-                            pprint.pprint(response)
-                        self.log.info(f"Stop command sent for pod {pod_id}.")
-                    except Exception as e:
-                        self.log.error(f"Error stopping pod {pod_id}: {e}")
             else:
                 self.log.info("No running pods found matching the name to stop.")
 
         if self.terminate:
             self.log.info(
-                f"Processing terminate action for {len(matching_pods)} pods matching name '{self.pod_name}'."
+                "Processing terminate action for %s pods matching name '%s'.",
+                len(matching_pods),
+                self.pod_name,
+            )
+            self._run_pod_actions(
+                self.client.terminate_pod,
+                [pod[const.POD_ID] for pod in matching_pods],
+                "terminate",
+                "terminating",
             )
-            for pod in matching_pods:
-                pod_id = pod[const.POD_ID]
-                try:
-                    self.log.debug(f"Attempting to terminate pod {pod_id}...")
-                    response = self.client.terminate_pod(pod_id)
-                    if self.log.isEnabledFor(logging.DEBUG):
-                        self.log.debug(f"Terminate API response for {pod_id}:")
-                        pprint.pprint(response)
-                    self.log.info(f"Terminate command sent for pod {pod_id}.")
-                except Exception as e:
-                    self.log.error(f"Error terminating pod {pod_id}: {e}")
 
         self.log.info("Cleanup actions processing finished.")
         return True
 
+    def _run_pod_actions(
+        self, action: Callable[[str], Any], pod_ids: list[str], verb: str, gerund: str
+    ) -> None:
+        """
+        Sends an API action (stop/terminate) for each pod concurrently.
+
+        Up to `cleanup_concurrency` calls run at once, and no more threads are
+        started than there are pods; the client's rate limiter still paces the
+        requests. Errors are logged per pod and never raised.
+
+        :param action: The client method to call with each pod ID.
+        :type action: Callable[[str], Any]
+        :param pod_ids: The IDs of the pods to act on.
+        :type pod_ids: list[str]
+        :param verb: The action name used in log messages, e.g. 'stop'.
+        :type verb: str
+        :param gerund: The '-ing' form of `verb` used in error messages, e.g. 'stopping'.
+        :type gerund: str
+        """
+        self._invalidate_pods_cache()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.cleanup_concurrency, len(pod_ids))),
+            thread_name_prefix=verb,
+        ) as executor:
+            futures = {}
+            for pod_id in pod_ids:
+                self.log.debug("Attempting to %s pod %s...", verb, pod_id)
+                futures[executor.submit(action, pod_id)] = pod_id
+            for future in as_completed(futures):
+                pod_id = futures[future]
+                try:
+                    response = future.result()
+                    self.log.debug("%s API response for %s: %r", verb.capitalize(), pod_id, response)
+                    self.log.info("%s command sent for pod %s.", verb.capitalize(), pod_id)
+                except RunpodApiError as e:
+                    self.log.error("Error %s pod %s: %s", gerund, pod_id, e)
+
     def _get_all_pods_from_api(self) -> list[dict[str, Any]] | None:
         """
         Helper to call the API client to get all pods.
 
+        The pod list is cached for `pods_cache_ttl` seconds, so repeated lookups
+        within one invocation share a single API call. The cache is invalidated
+        whenever this manager changes pod state.
+
         :return: A list of pod dictionaries from the API, or None if the call fails.
         :rtype: list[dict[str, Any]] | None
-        :raises Exception: If the API call fails.
+        :raises RunpodApiError: If the API call fails.
         """
+        if (
+            self._pods_cache is not None
+            and time.monotonic() - self._pods_cache_time < self.pods_cache_ttl
+        ):
+            self.log.debug("Using cached pod list (%s pods).", len(self._pods_cache))
+            return self._pods_cache
         self.log.debug("Retrieving all pods from RunPod API...")
         try:
             pods = self.client.get_pods()
-            self.log.debug(f"Retrieved {len(pods)} pods.")
-            if self.log.isEnabledFor(logging.DEBUG):
-                 pprint.pprint(pods)
+            self._pods_cache = pods
+            self._pods_cache_time = time.monotonic()
+            self.log.debug("Retrieved %s pods.", len(pods))
+            self.log.debug("Pods: %r", pods)
             return pods
-        except Exception as e:
-            self.log.error(f"Failed to retrieve pods from RunPod API: {e}")
+        except RunpodApiError as e:
+            self.log.error("Failed to retrieve pods from RunPod API: %s", e)
             return None
 
+    def _invalidate_pods_cache(self) -> None:
+        """
+        Discards the cached pod list, forcing the next lookup to hit the API.
+        """
+        self._pods_cache = None
+
+    def _filter_by_name(self, pods: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yields the pods matching the configured name, so callers that
+        only need the first match stop scanning there.
+
+        :param pods: The pod dictionaries to filter.
+        :type pods: list[dict[str, Any]]
+        :return: An iterator over the matching pods, in listing order.
+        :rtype: Iterator[dict[str, Any]]
+        """
+        return (pod for pod in pods if pod.get(const.POD_NAME_API) in self.pod_names)
+
     def find_first_pod_by_name(self) -> dict[str, Any] | None:
         """
         Finds the first pod matching the configured name.
@@ -274,45 +810,53 @@ class PodLifecycleManager:
                  or None if the API call failed.
         :rtype: dict[str, Any] | None
         """
-        self.log.debug(f"Searching for first pod matching name '{self.pod_name}'...")
+        self.log.debug("Searching for first pod matching name '%s'...", self.pod_name)
         all_pods = self._get_all_pods_from_api()
 
         if all_pods is None:
             self.log.error("API call to get pods failed. Cannot search for pod.")
             return None
 
-        for pod in all_pods:
-            if pod.get(const.POD_NAME_API) == self.pod_name:
-                self.log.debug(f"Found first matching pod: ID {pod.get(const.POD_ID)}")
-                if self.log.isEnabledFor(logging.DEBUG):
-                    pprint.pprint(pod)
-                return pod
+        pod = next(self._filter_by_name(all_pods), {})
+        if pod:
+            self.log.debug("Found first matching pod: ID %s", pod.get(const.POD_ID))
+            self.log.debug("Pod: %r", pod)
+            return pod
 
-        self.log.debug(f"No pod found matching name '{self.pod_name}'.")
+        self.log.debug("No pod found matching name '%s'.", self.pod_name)
         return {}
 
-    def find_all_pods_by_name(self) -> list[dict[str, Any]] | None:
+    def find_pods_by_name_partitioned(self) -> dict[str, list[dict[str, Any]]] | None:
         """
-        Finds all pods matching the configured name.
+        Finds all pods matching the configured name, and which of them are running,
+        in a single pass.
 
-        :return: A list of all matching pod dictionaries, or None if the API call fails.
-        :rtype: list[dict[str, Any]] | None
+        :return: A dictionary with 'running' (RUNNING) and 'all_matching' (any status)
+                 lists of pod dictionaries, or None if the API call fails.
+        :rtype: dict[str, list[dict[str, Any]]] | None
         """
-        self.log.debug(f"Searching for all pods matching name '{self.pod_name}'...")
+        self.log.debug("Searching for all pods matching name '%s' by status...", self.pod_name)
         all_pods = self._get_all_pods_from_api()
 
         if all_pods is None:
             self.log.error("API call to get pods failed. Cannot find matching pods.")
             return None
 
-        matching_pods = [
-            pod for pod in all_pods if pod.get(const.POD_NAME_API) == self.pod_name
-        ]
-        self.log.debug(f"Found {len(matching_pods)} pods matching name '{self.pod_name}'.")
-        if self.log.isEnabledFor(logging.DEBUG) and matching_pods:
-            self.log.debug(f"Matching pod IDs: {[p.get(const.POD_ID) for p in matching_pods]}")
-            pprint.pprint(matching_pods)
-        return matching_pods
+        running: list[dict[str, Any]] = []
+        all_matching: list[dict[str, Any]] = []
+        for pod in self._filter_by_name(all_pods):
+            all_matching.append(pod)
+            if pod.get(const.POD_STATUS) == const.POD_STATUS_RUNNING:
+                running.append(pod)
+        self.log.debug(
+            "Found %s pods matching name '%s' (%s running).",
+            len(all_matching),
+            self.pod_name,
+            len(running),
+        )
+        if self.log.isEnabledFor(logging.DEBUG) and all_matching:
+            self.log.debug("Matching pod IDs: %s", [p.get(const.POD_ID) for p in all_matching])
+        return {"running": running, "all_matching": all_matching}
 
     def _attempt_resume_pod(self, pod_id: str) -> bool:
         """
@@ -323,49 +867,98 @@ class PodLifecycleManager:
         :return: True if the resume API call was initiated successfully, False otherwise.
         :rtype: bool
         """
-        self.log.debug(f"Attempting to resume pod {pod_id}...")
+        self.log.debug("Attempting to resume pod %s...", pod_id)
+        self._invalidate_pods_cache()
         try:
             resume_response = self.client.resume_pod(pod_id, gpu_count=self.gpu_count)
-            if self.log.isEnabledFor(logging.DEBUG):
-                self.log.debug(f"Resume API response for {pod_id}:")
-                pprint.pprint(resume_response)
-            self.log.debug(f"Resume command sent for pod {pod_id}.")
+            self.log.debug("Resume API response for %s: %r", pod_id, resume_response)
+            self.log.debug("Resume command sent for pod %s.", pod_id)
             return True
-        except Exception as e:
-            self.log.error(f"API error resuming pod {pod_id}: {e}")
+        except RunpodApiError as e:
+            self.log.error("API error resuming pod %s: %s", pod_id, e)
             return False
 
+    def _poll_pod_running(
+        self, pod_id: str, cancelled: threading.Event | None = None
+    ) -> dict[str, Any]:
+        """
+        Polls a pod until it reports RUNNING or the validation wait budget is spent.
+
+        The wait between polls starts at `validate_poll_initial` seconds and grows
+        exponentially, capped at const.VALIDATE_POLL_MAX_DELAY_SECONDS. No poll
+        starts more than `validate_poll_timeout` seconds after the first, time
+        spent in API calls included.
+
+        A missing or malformed response (the SDK returns None for an unknown pod)
+        counts as a pod that is not RUNNING yet.
+
+        :param pod_id: The ID of the pod to poll.
+        :type pod_id: str
+        :param cancelled: Optional event; once set, polling stops at the next wait.
+        :type cancelled: threading.Event | None
+        :return: The most recently retrieved pod details, `{}` if the last response was empty.
+        :rtype: dict[str, Any]
+        :raises RunpodApiError: If the API call fails.
+        """
+        delay = self.validate_poll_initial
+        deadline = time.monotonic() + self.validate_poll_timeout
+        while True:
+            pod_details = self.client.get_pod(pod_id)
+            if not isinstance(pod_details, Mapping):
+                pod_details = {}
+            pod_status = pod_details.get(const.POD_STATUS)
+            remaining = deadline - time.monotonic()
+            if pod_status == const.POD_STATUS_RUNNING or remaining <= 0:
+                return pod_details
+            wait = min(delay, const.VALIDATE_POLL_MAX_DELAY_SECONDS, remaining)
+            self.log.debug(
+                "Pod %s is not RUNNING yet (status: %s). Polling again in %s seconds...",
+                pod_id,
+                pod_status,
+                wait,
+            )
+            if cancelled is None:
+                time.sleep(wait)
+            elif cancelled.wait(wait):
+                self.log.debug("Stopped polling pod %s after cancellation.", pod_id)
+                return pod_details
+            delay *= const.VALIDATE_POLL_BACKOFF_FACTOR
+
     def _validate_resumed_pod(self, pod_id: str) -> bool:
         """
         Validates if a pod has reached the RUNNING state after a resume attempt.
 
+        Polls the pod with exponential backoff, as state transitions are asynchronous.
+
         :param pod_id: The ID of the pod to validate.
         :type pod_id: str
         :return: True if the pod is RUNNING, False otherwise.
         :rtype: bool
         """
-        self.log.debug(f"Validating status of pod {pod_id} after resume attempt...")
+        self.log.debug("Validating status of pod %s after resume attempt...", pod_id)
         try:
-            updated_pod_info = self.client.get_pod(pod_id)
-            if self.log.isEnabledFor(logging.DEBUG):
-                self.log.debug(f"Updated pod info for {pod_id}:")
-                pprint.pprint(updated_pod_info)
+            updated_pod_info = self._poll_pod_running(pod_id)
+            self.log.debug("Updated pod info for %s: %r", pod_id, updated_pod_info)
             if updated_pod_info.get(const.POD_STATUS) == const.POD_STATUS_RUNNING:
-                self.log.info(f"Pod {pod_id} resumed successfully and is RUNNING.")
+                self.log.info("Pod %s resumed successfully and is RUNNING.", pod_id)
                 return True
             else:
                 self.log.warning(
-                    f"Pod {pod_id} did not reach RUNNING status after resume attempt (current status: {updated_pod_info.get(const.POD_STATUS)})."
+                    "Pod %s did not reach RUNNING status after resume attempt (current status: %s).",
+                    pod_id,
+                    updated_pod_info.get(const.POD_STATUS),
                 )
                 return False
-        except Exception as e:
-            self.log.error(f"API error validating pod {pod_id} after resume: {e}")
+        except RunpodApiError as e:
+            self.log.error("API error validating pod %s after resume: %s", pod_id, e)
             return False
 
     def _handle_existing_pod(self, pod: dict[str, Any]) -> str | None:
         """
         Manages an existing pod based on its status.
 
+        Dispatches to the handler registered for the status in `_status_handlers`.
+
         :param pod: The dictionary representing the existing pod.
         :type pod: dict[str, Any]
         :return: The pod ID if the pod is running and valid after handling, None otherwise.
@@ -374,22 +967,83 @@ class PodLifecycleManager:
         pod_id: str = pod[const.POD_ID]
         pod_status = pod.get(const.POD_STATUS)
         self.log.debug(
-            f"Handling existing pod '{self.pod_name}' (ID: {pod_id}) with status: {pod_status}"
+            "Handling existing pod '%s' (ID: %s) with status: %s", self.pod_name, pod_id, pod_status
         )
 
+        handler = self._status_handlers.get(pod_status, self._resume_then_validate)
+        return handler(pod_id)
+
+    def _already_running(self, pod_id: str) -> str:
+        """
+        Status handler for a pod that is already RUNNING.
+
+        :param pod_id: The ID of the pod.
+        :type pod_id: str
+        :return: The pod ID.
+        :rtype: str
+        """
+        self.log.info("Pod %s is already running.", pod_id)
+        return pod_id
+
+    def _wait_for_running(self, pod_id: str) -> str | None:
+        """
+        Status handler for a pod that is still starting up (CREATED/RESTARTING).
+
+        Resuming such a pod is redundant and can make the API fail, so it is only
+        polled until RUNNING. Terminates the pod if it never gets there.
+
+        :param pod_id: The ID of the pod.
+        :type pod_id: str
+        :return: The pod ID if the pod reached RUNNING, None otherwise.
+        :rtype: str | None
+        """
+        self.log.info("Pod %s is starting. Waiting for it to reach RUNNING...", pod_id)
+        try:
+            pod_status = self._poll_pod_running(pod_id).get(const.POD_STATUS)
+        except RunpodApiError as e:
+            self.log.error("API error waiting for pod %s to start: %s", pod_id, e)
+            pod_status = None
         if pod_status == const.POD_STATUS_RUNNING:
-            self.log.info(f"Pod {pod_id} is already running.")
+            self.log.info("Pod %s is RUNNING.", pod_id)
             return pod_id
+        self.log.warning(
+            "Pod %s did not reach RUNNING status (current status: %s). Terminating...", pod_id, pod_status
+        )
+        self._terminate_pod_silently(pod_id)
+        return None
+
+    def _skip_terminated(self, pod_id: str) -> None:
+        """
+        Status handler for a TERMINATED pod, which can no longer be resumed.
+
+        :param pod_id: The ID of the pod.
+        :type pod_id: str
+        :return: None, so a new pod is created instead.
+        :rtype: None
+        """
+        self.log.info("Pod %s is terminated and cannot be resumed.", pod_id)
+        return None
 
+    def _resume_then_validate(self, pod_id: str) -> str | None:
+        """
+        Status handler for a stopped pod (and the fallback for unknown statuses).
+
+        Resumes the pod and validates it reaches RUNNING, terminating it on failure.
+
+        :param pod_id: The ID of the pod.
+        :type pod_id: str
+        :return: The pod ID if the pod is running after resuming, None otherwise.
+        :rtype: str | None
+        """
         if self._attempt_resume_pod(pod_id):
             if self._validate_resumed_pod(pod_id):
                 return pod_id
             else:
-                self.log.warning(f"Validation failed after resuming pod {pod_id}. Terminating...")
+                self.log.warning("Validation failed after resuming pod %s. Terminating...", pod_id)
                 self._terminate_pod_silently(pod_id)
                 return None
         else:
-            self.log.warning(f"Resume attempt failed for pod {pod_id}. Terminating...")
+            self.log.warning("Resume attempt failed for pod %s. Terminating...", pod_id)
             self._terminate_pod_silently(pod_id)
             return None
 
@@ -397,6 +1051,9 @@ class PodLifecycleManager:
         """
         Attempts to create a new pod, iterating through configured GPU types.
 
+        With `create_parallelism` > 1, GPU types are tried in priority-ordered
+        windows of that size, concurrently within each window.
+
         :return: The ID of the successfully created and validated pod, or None otherwise.
         :rtype: str | None
         """
@@ -405,149 +1062,287 @@ class PodLifecycleManager:
             self.log.error("No GPU types specified in configuration. Cannot create pod.")
             return None
 
-        for gpu_type in self.gpu_types:
-            for attempt in range(1, self.create_retries + 1):
-                self.log.debug(
-                    f"Processing GPU type '{gpu_type}' (attempt {attempt}/{self.create_retries})..."
-                )
-                pod_id = self._create_and_validate_pod_with_gpu(gpu_type)
+        if self.create_parallelism > 1:
+            pod_id = self._attempt_parallel_pod_creation()
+            if pod_id:
+                return pod_id
+        else:
+            for gpu_type in self.gpu_types:
+                pod_id = self._create_with_retries(gpu_type)
                 if pod_id:
                     return pod_id
-                self.log.warning(
-                    f"Create/validate attempt {attempt} failed for GPU type '{gpu_type}'."
-                )
-                if attempt < self.create_retries:
-                    self.log.debug(f"Waiting {self.create_wait} seconds before next attempt for '{gpu_type}'...")
-                    time.sleep(self.create_wait)
-                else:
-                    self.log.warning(f"All {self.create_retries} attempts failed for GPU type '{gpu_type}'.")
         self.log.error(
-            f"All creation attempts failed for all specified GPU types: {self.gpu_types}."
+            "All creation attempts failed for all specified GPU types: %s.", self.gpu_types
         )
         return None
 
-    def _create_and_validate_pod_with_gpu(self, gpu_type: str) -> str | None:
+    def _attempt_parallel_pod_creation(self) -> str | None:
+        """
+        Tries GPU types concurrently, `create_parallelism` at a time, in priority order.
+
+        The first pod created and validated within a window wins. Remaining attempts
+        in the window stop retrying, and any pod they still manage to create is
+        terminated. Later windows are only tried if the whole window failed.
+
+        :return: The ID of the winning pod, or None if every window failed.
+        :rtype: str | None
+        """
+        for start in range(0, len(self.gpu_types), self.create_parallelism):
+            window = self.gpu_types[start:start + self.create_parallelism]
+            self.log.debug("Attempting concurrent pod creation with GPU types: %s", window)
+            cancelled = threading.Event()
+            winner: str | None = None
+            with ThreadPoolExecutor(
+                max_workers=len(window), thread_name_prefix="create"
+            ) as executor:
+                futures = {
+                    executor.submit(self._create_with_retries, gpu_type, cancelled): gpu_type
+                    for gpu_type in window
+                }
+                for future in as_completed(futures):
+                    try:
+                        pod_id = future.result()
+                    except Exception as e:
+                        self.log.error(
+                            "Unexpected error creating pod with GPU type '%s': %s",
+                            futures[future],
+                            e,
+                        )
+                        continue
+                    if not pod_id:
+                        continue
+                    if winner is None:
+                        winner = pod_id
+                        cancelled.set()
+                    else:
+                        self.log.warning(
+                            "Pod %s was created after pod %s already succeeded. Terminating...",
+                            pod_id,
+                            winner,
+                        )
+                        self._terminate_pod_silently(pod_id)
+            if winner:
+                return winner
+        return None
+
+    def _create_with_retries(
+        self, gpu_type: str, cancelled: threading.Event | None = None
+    ) -> str | None:
+        """
+        Attempts to create and validate a pod with one GPU type, retrying up to
+        `create_retries` times with the waits given by `_backoff_wait()`.
+
+        :param gpu_type: The GPU type ID to use.
+        :type gpu_type: str
+        :param cancelled: Optional event; once set, no further attempts are started
+            and a pending backoff wait or validation is cut short.
+        :type cancelled: threading.Event | None
+        :return: The pod ID if an attempt succeeded, None otherwise.
+        :rtype: str | None
+        """
+        for attempt in range(1, self.create_retries + 1):
+            if cancelled is not None and cancelled.is_set():
+                self.log.debug("Skipping remaining attempts for GPU type '%s'.", gpu_type)
+                return None
+            self.log.debug(
+                "Processing GPU type '%s' (attempt %s/%s)...",
+                gpu_type,
+                attempt,
+                self.create_retries,
+            )
+            pod_id = self._create_and_validate_pod_with_gpu(gpu_type, cancelled)
+            if pod_id:
+                return pod_id
+            self.log.warning(
+                "Create/validate attempt %s failed for GPU type '%s'.", attempt, gpu_type
+            )
+            if attempt < self.create_retries:
+                delay = self._backoff_wait(attempt)
+                self.log.debug("Waiting %.1f seconds before next attempt for '%s'...", delay, gpu_type)
+                if cancelled is None:
+                    time.sleep(delay)
+                elif cancelled.wait(delay):
+                    self.log.debug("Skipping remaining attempts for GPU type '%s'.", gpu_type)
+                    return None
+            else:
+                self.log.warning("All %s attempts failed for GPU type '%s'.", self.create_retries, gpu_type)
+        return None
+
+    def _backoff_wait(self, attempt: int) -> float:
+        """
+        Computes the wait after a failed creation attempt.
+
+        Starts at `create_wait` seconds and grows by const.CREATE_RETRY_BACKOFF_FACTOR
+        per attempt, capped at `create_max_wait`, plus up to
+        const.CREATE_RETRY_JITTER_FRACTION of random jitter.
+
+        :param attempt: The 1-based number of the attempt that just failed.
+        :type attempt: int
+        :return: The number of seconds to wait.
+        :rtype: float
+        """
+        delay = min(
+            self.create_wait * const.CREATE_RETRY_BACKOFF_FACTOR ** (attempt - 1),
+            self.create_max_wait,
+        )
+        return delay + random.uniform(0, delay * const.CREATE_RETRY_JITTER_FRACTION)
+
+    def _create_and_validate_pod_with_gpu(
+        self, gpu_type: str, cancelled: threading.Event | None = None
+    ) -> str | None:
         """
         Attempts to create a pod with a specific GPU type and validates it.
 
         :param gpu_type: The GPU type ID to use for this attempt.
         :type gpu_type: str
+        :param cancelled: Optional event; if set once the pod is created, the pod
+            is terminated instead of validated, and once set during validation,
+            polling stops and the pod is terminated unless already RUNNING.
+        :type cancelled: threading.Event | None
         :return: The pod ID if creation and validation are successful, None otherwise.
         :rtype: str | None
         """
-        self.log.debug(f"Attempting to create and validate pod with GPU type '{gpu_type}'...")
+        self.log.debug("Attempting to create and validate pod with GPU type '%s'...", gpu_type)
         new_pod_id = self._create_pod_attempt(gpu_type)
-        if type(new_pod_id) is str:
-            if self._validate_new_pod(new_pod_id):
+        if new_pod_id is not None and cancelled is not None and cancelled.is_set():
+            self.log.warning(
+                "Pod %s was created after another pod already succeeded. Terminating...", new_pod_id
+            )
+            self._terminate_pod_silently(new_pod_id)
+            return None
+        if new_pod_id is not None:
+            if self._validate_new_pod(new_pod_id, cancelled):
                 self.log.info(
-                    f"Pod '{self.pod_name}' (ID: {new_pod_id}) created and validated successfully with GPU '{gpu_type}'."
+                    "Pod '%s' (ID: %s) created and validated successfully with GPU '%s'.",
+                    self.pod_name,
+                    new_pod_id,
+                    gpu_type,
                 )
                 return new_pod_id
             else:
                 self.log.warning(
-                    f"Validation failed for newly created pod {new_pod_id} with GPU '{gpu_type}'. Pod has been terminated."
+                    "Validation failed for newly created pod %s with GPU '%s'. Pod has been terminated.",
+                    new_pod_id,
+                    gpu_type,
                 )
                 return None
         else:
-            self.log.warning(f"Pod creation attempt failed for GPU type '{gpu_type}'.")
+            self.log.warning("Pod creation attempt failed for GPU type '%s'.", gpu_type)
             return None
 
-    def _create_pod_attempt(self, gpu_type_id: str) -> str | None:
+    def _create_pod_kwargs(self, gpu_type_id: str) -> dict[str, Any]:
         """
-        Performs a single attempt to create a pod with a specific GPU type.
+        Builds the create_pod() keyword arguments for one attempt from the
+        manager's current attributes and config.
 
         :param gpu_type_id: The GPU type ID to use for this attempt.
         :type gpu_type_id: str
-        :return: The new pod ID if the creation API call is successful and returns an ID, None otherwise.
-        :rtype: str | None
+        :return: The keyword arguments for RunpodApiClient.create_pod().
+        :rtype: dict[str, Any]
         """
-        self.log.debug(f"Initiating create_pod API call for GPU type '{gpu_type_id}'.")
-        create_params = {
+        return {
             "name": self.pod_name,
             "image_name": self.config[const.IMAGE_NAME],
             "gpu_type_id": gpu_type_id,
-            "gpu_count": self.gpu_count,
             "container_disk_in_gb": self.config[const.CONTAINER_DISK_IN_GB],
-            "cloud_type": self.config.get(const.CLOUD_TYPE, const.DEFAULT_CLOUD_TYPE),
-            "support_public_ip": self.config.get(const.SUPPORT_PUBLIC_IP, const.DEFAULT_SUPPORT_PUBLIC_IP),
-            "start_ssh": self.config.get(const.START_SSH, const.DEFAULT_START_SSH),
-            "volume_in_gb": self.config.get(const.VOLUME_IN_GB, const.DEFAULT_VOLUME_IN_GB),
-            "min_vcpu_count": self.config.get(const.MIN_VCPU_COUNT, const.DEFAULT_MIN_VCPU_COUNT),
-            "min_memory_in_gb": self.config.get(const.MIN_MEMORY_IN_GB, const.DEFAULT_MIN_MEMORY_IN_GB),
-            "docker_args": self.config.get(const.DOCKER_ARGS, const.DEFAULT_DOCKER_ARGS),
-            "volume_mount_path": self.config.get(const.VOLUME_MOUNT_PATH, const.DEFAULT_VOLUME_MOUNT_PATH),
+            # Optional parameters with defaults
+            **{key: self.config.get(key, default) for key, default in const.DEFAULTS.items()},
+            const.GPU_COUNT: self.gpu_count,
             # Optional parameters - only include if present in config
-            **{k: v for k, v in {
-                const.DATA_CENTER_ID: self.config.get(const.DATA_CENTER_ID),
-                const.COUNTRY_CODE: self.config.get(const.COUNTRY_CODE),
-                const.PORTS: self.config.get(const.PORTS),
-                const.ENV: self.config.get(const.ENV),
-                const.TEMPLATE_ID: self.config.get(const.TEMPLATE_ID),
-                const.NETWORK_VOLUME_ID: self.config.get(const.NETWORK_VOLUME_ID),
-                const.ALLOWED_CUDA_VERSIONS: self.config.get(const.ALLOWED_CUDA_VERSIONS),
-                const.MIN_DOWNLOAD: self.config.get(const.MIN_DOWNLOAD),
-                const.MIN_UPLOAD: self.config.get(const.MIN_UPLOAD),
-            }.items() if v is not None}
+            **{
+                key: self.config[key]
+                for key in (
+                    const.DATA_CENTER_ID,
+                    const.COUNTRY_CODE,
+                    const.PORTS,
+                    const.ENV,
+                    const.TEMPLATE_ID,
+                    const.NETWORK_VOLUME_ID,
+                    const.ALLOWED_CUDA_VERSIONS,
+                    const.MIN_DOWNLOAD,
+                    const.MIN_UPLOAD,
+                )
+                if self.config.get(key) is not None
+            },
         }
-        if self.log.isEnabledFor(logging.DEBUG):
-            self.log.debug("Create pod parameters:")
-            pprint.pprint(create_params)
 
+    def _create_pod_attempt(self, gpu_type_id: str) -> str | None:
+        """
+        Performs a single attempt to create a pod with a specific GPU type.
+
+        :param gpu_type_id: The GPU type ID to use for this attempt.
+        :type gpu_type_id: str
+        :return: The new pod ID if the creation API call is successful and returns an ID, None otherwise.
+        :rtype: str | None
+        """
+        self.log.debug("Initiating create_pod API call for GPU type '%s'.", gpu_type_id)
+        create_kwargs = self._create_pod_kwargs(gpu_type_id)
+        self.log.debug("Create pod parameters: %r", create_kwargs)
+
+        self._invalidate_pods_cache()
         try:
-            response = self.client.create_pod(**create_params)
-            if self.log.isEnabledFor(logging.DEBUG):
-                self.log.debug("Create pod API response:")
-                pprint.pprint(response)
+            response = self.client.create_pod(**create_kwargs)
+            self.log.debug("Create pod API response: %r", response)
 
-            new_pod_id = response.get(const.POD_ID)
+            new_pod_id = response.get(const.POD_ID) if isinstance(response, Mapping) else None
             if new_pod_id:
-                self.log.info(f"Pod creation initiated via API. New Pod ID: {new_pod_id}")
+                self.log.info("Pod creation initiated via API. New Pod ID: %s", new_pod_id)
                 return new_pod_id
             else:
                 self.log.error(
-                    f"Pod creation API call succeeded but did not return an ID. Response: {response}"
+                    "Pod creation API call succeeded but did not return an ID. Response: %s",
+                    response,
                 )
                 return None
-        except Exception as e:
-            self.log.error(f"API error creating pod with GPU {gpu_type_id}: {e}")
+        except RunpodApiError as e:
+            self.log.error("API error creating pod with GPU %s: %s", gpu_type_id, e)
             return None
 
-    def _validate_new_pod(self, pod_id: str) -> bool:
+    def _validate_new_pod(self, pod_id: str, cancelled: threading.Event | None = None) -> bool:
         """
         Validates a newly created pod.
 
         :param pod_id: The ID of the pod to validate.
         :type pod_id: str
-        Calls client.get_pod() and checks if the pod details (name, status)
-        match the expected state after creation. Terminates the pod if validation fails.
+        Polls the pod until it is RUNNING (or the wait budget is spent) and checks
+        if the pod details (name, status) match the expected state after creation.
+        Terminates the pod if validation fails.
 
         :param pod_id: The ID of the pod to validate.
         :type pod_id: str
+        :param cancelled: Optional event; once set, polling stops and the pod
+            fails validation unless it is already RUNNING.
+        :type cancelled: threading.Event | None
         :return: True if the pod is valid, False otherwise.
         :rtype: bool
         """
-        self.log.debug(f"Validating newly created pod {pod_id}...")
+        self.log.debug("Validating newly created pod %s...", pod_id)
         try:
-            pod_details = self.client.get_pod(pod_id)
-            if self.log.isEnabledFor(logging.DEBUG):
-                self.log.debug(f"Pod details for validation ({pod_id}):")
-                pprint.pprint(pod_details)
+            pod_details = self._poll_pod_running(pod_id, cancelled)
+            self.log.debug("Pod details for validation (%s): %r", pod_id, pod_details)
 
             pod_name_matches = pod_details.get(const.POD_NAME_API) == self.pod_name
             pod_is_running = pod_details.get(const.POD_STATUS) == const.POD_STATUS_RUNNING
 
             if pod_name_matches and pod_is_running:
-                self.log.debug(f"Pod {pod_id} validation successful.")
+                self.log.debug("Pod %s validation successful.", pod_id)
                 return True
             else:
                 self.log.warning(
-                    f"Pod {pod_id} validation failed. Name matches: {pod_name_matches} (Expected: '{self.pod_name}', Got: '{pod_details.get(const.POD_NAME_API)}'). Is running: {pod_is_running} (Status: '{pod_details.get(const.POD_STATUS)}'). Terminating pod..."
+                    "Pod %s validation failed. Name matches: %s (Expected: '%s', Got: '%s'). Is running: %s (Status: '%s'). Terminating pod...",
+                    pod_id,
+                    pod_name_matches,
+                    self.pod_name,
+                    pod_details.get(const.POD_NAME_API),
+                    pod_is_running,
+                    pod_details.get(const.POD_STATUS),
                 )
                 self._terminate_pod_silently(pod_id)
                 return False
         except Exception as e:
-            self.log.error(f"Error during validation of pod {pod_id}: {e}")
-            self.log.warning(f"Terminating pod {pod_id} due to validation error.")
+            # Not just API errors: the pod exists, so it must never be left running
+            self.log.error("Error during validation of pod %s: %s", pod_id, e)
+            self.log.warning("Terminating pod %s due to validation error.", pod_id)
             self._terminate_pod_silently(pod_id)
             return False
 
@@ -558,12 +1353,13 @@ class PodLifecycleManager:
         :param pod_id: The ID of the pod to terminate.
         :type pod_id: str
         """
+        self._invalidate_pods_cache()
         try:
-            self.log.warning(f"Terminating pod {pod_id}...")
+            self.log.warning("Terminating pod %s...", pod_id)
             self.client.terminate_pod(pod_id)
-            self.log.debug(f"Terminate command sent for pod {pod_id}.")
-        except Exception as e:
-            self.log.error(f"Failed to terminate pod {pod_id} silently: {e}")
+            self.log.debug("Terminate command sent for pod %s.", pod_id)
+        except RunpodApiError as e:
+            self.log.error("Failed to terminate pod %s silently: %s", pod_id, e)
 
     def get_pod_counts(self) -> dict[str, int] | None:
         """
@@ -572,21 +1368,17 @@ class PodLifecycleManager:
         :return: A dictionary with 'total' and 'running' pod counts, or None if API fails.
         :rtype: dict[str, int] | None
         """
-        self.log.debug(f"Getting counts for pods matching name '{self.pod_name}'...")
-        matching_pods = self.find_all_pods_by_name()
+        self.log.debug("Getting counts for pods matching name '%s'...", self.pod_name)
+        partitioned_pods = self.find_pods_by_name_partitioned()
 
         # Check if the API call failed
-        if matching_pods is None:
+        if partitioned_pods is None:
             self.log.error("API call to get pods failed. Cannot determine pod counts.")
             return None
 
-        total_count = len(matching_pods)
-        running_count = sum(
-            1
-            for pod in matching_pods
-            if pod.get(const.POD_STATUS) == const.POD_STATUS_RUNNING
-        )
-        self.log.debug(f"Pod counts: Total={total_count}, Running={running_count}")
+        total_count = len(partitioned_pods["all_matching"])
+        running_count = len(partitioned_pods["running"])
+        self.log.debug("Pod counts: Total=%s, Running=%s", total_count, running_count)
         return {"total": total_count, "running": running_count}
 
 
@@ -603,6 +1395,7 @@ class RunpodSingletonManager:
         stop: bool = False,
         terminate: bool = False,
         debug: bool = False,
+        pods_file_cache_ttl: float = const.DEFAULT_PODS_FILE_CACHE_TTL_SECONDS,
     ):
         """
         Initializes the RunpodSingletonManager.
@@ -620,6 +1413,8 @@ class RunpodSingletonManager:
         :type terminate: bool
         :param debug: Flag to enable debug logging.
         :type debug: bool
+        :param pods_file_cache_ttl: Seconds a pod listing may be reused across invocations; 0 disables it.
+        :type pods_file_cache_ttl: float
         :raises FileNotFoundError: If the config file is not found.
         :raises yaml.YAMLError: If the config file is invalid.
         :raises RuntimeError: If the API key cannot be found.
@@ -628,15 +1423,33 @@ class RunpodSingletonManager:
         self.stop: bool = stop
         self.terminate: bool = terminate
         self.debug: bool = debug
+        self.pods_file_cache_ttl: float = pods_file_cache_ttl
         self.log: logging.Logger = Logger(self.__class__.__name__, debug=self.debug)
 
-        self.log.debug(f"Loading configuration from: {self.config_path}")
+        self.log.debug("Loading configuration from: %s", self.config_path)
         self.config: dict[str, Any] = load_config(self.config_path)
         self.log.debug("Configuration loaded successfully.")
 
         self.client: RunpodApiClient = self._setup_api_client(api_key)
+        self._manager: PodLifecycleManager | None = None
         self.log.debug("RunpodSingletonManager initialized.")
 
+    def _get_lifecycle_manager(self) -> PodLifecycleManager:
+        """
+        Returns the PodLifecycleManager shared by all operations, creating it on first use.
+
+        Sharing one instance lets consecutive operations (e.g. count_pods() then
+        run()) reuse its cached pod listing.
+
+        :return: The shared PodLifecycleManager instance.
+        :rtype: PodLifecycleManager
+        """
+        if self._manager is None:
+            self._manager = PodLifecycleManager(
+                self.client, self.config, self.log, self.stop, self.terminate
+            )
+        return self._manager
+
     def _setup_api_client(self, api_key: str | None) -> RunpodApiClient:
         """
         Retrieves the API key and initializes the RunpodApiClient.
@@ -658,7 +1471,19 @@ class RunpodSingletonManager:
                 "RunPod API key not found. Provide it via --api-key or set RUNPOD_API_KEY environment variable."
             )
         self.log.debug("API key found. Initializing client.")
-        return RunpodApiClient(api_key=found_api_key)
+        return RunpodApiClient(api_key=found_api_key, pods_file_cache_ttl=self.pods_file_cache_ttl)
+
+    def close(self) -> None:
+        """
+        Releases the API client's pooled HTTP connections.
+        """
+        self.client.close()
+
+    def __enter__(self) -> "RunpodSingletonManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def count_pods(self) -> dict[str, int] | None:
         """
@@ -668,9 +1493,7 @@ class RunpodSingletonManager:
         :rtype: dict[str, int] | None
         """
         self.log.debug("Retrieving pod counts...")
-        manager = PodLifecycleManager(
-            self.client, self.config, self.log, stop=False, terminate=False
-        )
+        manager = self._get_lifecycle_manager()
         counts = manager.get_pod_counts()
         return counts
 
@@ -685,24 +1508,23 @@ class RunpodSingletonManager:
         self.log.debug("RunpodSingletonManager run() started.")
         result: str | bool | None = None
         try:
-            manager = PodLifecycleManager(
-                self.client, self.config, self.log, self.stop, self.terminate
-            )
+            manager = self._get_lifecycle_manager()
+            manager.set_cleanup_flags(self.stop, self.terminate)
             if self.stop or self.terminate:
                 self.log.info("Executing cleanup actions...")
                 result = manager.perform_cleanup_actions()
-                self.log.info(f"Cleanup actions completed with result: {result}")
+                self.log.info("Cleanup actions completed with result: %s", result)
             else:
                 self.log.info("Executing pod management...")
                 result = manager.manage()
                 if result is None:
                     self.log.warning("Pod management failed.")
                 else:
-                    self.log.info(f"Pod management successful. Pod ID: {result}")
+                    self.log.info("Pod management successful. Pod ID: %s", result)
             return result
         except Exception as e:
             self.log.error(
-                f"An unexpected error occurred during execution: {e}", exc_info=self.debug
+                "An unexpected error occurred during execution: %s", e, exc_info=self.debug
             )
             return None
 
@@ -742,6 +1564,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Terminate all pods matching the configured name and exit (can be combined with --stop).",
     )
+    parser.add_argument(
+        "--pods-file-cache-ttl",
+        type=float,
+        default=const.DEFAULT_PODS_FILE_CACHE_TTL_SECONDS,
+        help="Reuse a pod listing fetched by an earlier invocation within this many seconds (0 disables).",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -758,6 +1586,10 @@ def load_config(config_path: Path) -> dict[str, Any]:
     """
     Loads the YAML configuration file.
 
+    Uses the LibYAML-backed C loader when PyYAML was built with it. Files
+    without environment variable references skip the `!ENV` interpolation
+    pass.
+
     :param config_path: Path to the configuration file.
     :type config_path: Path
     :return: Dictionary containing the configuration.
@@ -766,7 +1598,10 @@ def load_config(config_path: Path) -> dict[str, Any]:
     :raises yaml.YAMLError: If the config file is invalid YAML.
     """
     try:
-        return parse_config(config_path)
+        data = Path(config_path).read_text(encoding="utf-8")
+        if "${" in data or "!ENV" in data:
+            return parse_config(data=data, loader=_Loader)
+        return yaml.load(data, Loader=_Loader)
     except FileNotFoundError:
         raise FileNotFoundError(f"Config file '{config_path}' not found.")
     except yaml.YAMLError as e:
@@ -780,9 +1615,15 @@ def main() -> None:
     """
     exit_code = const.EXIT_FAILURE
     args = parse_args()
+    manager = None
     try:
         manager = RunpodSingletonManager(
-            args.config, args.api_key, args.stop, args.terminate, args.debug
+            args.config,
+            args.api_key,
+            args.stop,
+            args.terminate,
+            args.debug,
+            pods_file_cache_ttl=args.pods_file_cache_ttl,
         )
         if args.count:
             counts = manager.count_pods()
@@ -805,6 +1646,8 @@ def main() -> None:
             traceback.print_exc(file=sys.stderr)
         exit_code = const.EXIT_FAILURE
     finally:
+        if manager is not None:
+            manager.close()
         sys.exit(exit_code)
 
 
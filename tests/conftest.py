@@ -0,0 +1,102 @@
+import copy
+import pytest
+import argparse
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Mapping
+from unittest.mock import MagicMock, Mock, create_autospec
+
+from runpod_singleton import constants as const
+from runpod_singleton.singleton import RunpodSingletonManager
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixture replacing time.sleep with a no-op for every test so retries and polling don't wait."""
+    monkeypatch.setattr("runpod_singleton.singleton.time.sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Fixture replacing time.sleep with a MagicMock, for tests that assert on sleeps."""
+    sleep = MagicMock(return_value=None)
+    monkeypatch.setattr("runpod_singleton.singleton.time.sleep", sleep)
+    return sleep
+
+
+@pytest.fixture(scope="session")
+def mock_args_prototype() -> argparse.Namespace:
+    """Fixture to build the default argparse.Namespace once per session."""
+    args = argparse.Namespace()
+    args.config = MagicMock(spec=Path)
+    args.api_key = "test_api_key_arg"
+    args.count = False  # Default to False for most tests
+    args.stop = False  # Default to False
+    args.terminate = False  # Default to False
+    args.debug = False  # Default to False
+    args.pods_file_cache_ttl = 0.0
+    return args
+
+
+@pytest.fixture
+def mock_args(mock_args_prototype: argparse.Namespace) -> argparse.Namespace:
+    """Fixture to give each test its own copy of the default argparse.Namespace."""
+    return copy.copy(mock_args_prototype)
+
+
+@pytest.fixture
+def manager_mock() -> MagicMock:
+    """
+    Fixture for an autospecced RunpodSingletonManager instance, so calls
+    with the wrong signature fail.
+    """
+    return create_autospec(RunpodSingletonManager, instance=True)
+
+
+@pytest.fixture
+def main_mocks(
+    monkeypatch: pytest.MonkeyPatch, mock_args: argparse.Namespace, manager_mock: MagicMock
+) -> SimpleNamespace:
+    """
+    Fixture replacing parse_args, RunpodSingletonManager and sys.exit for
+    main(), with parse_args returning `mock_args` and the manager class
+    returning `manager_mock`.
+
+    The mocks are exposed as the `parse_args`, `manager_class`, `manager` and
+    `exit` attributes of the returned namespace.
+    """
+    # Plain Mocks where only calls are inspected; no magic methods needed
+    mocks = SimpleNamespace(
+        parse_args=Mock(return_value=mock_args),
+        manager_class=MagicMock(return_value=manager_mock),
+        manager=manager_mock,
+        exit=Mock(),
+    )
+    monkeypatch.setattr("runpod_singleton.singleton.parse_args", mocks.parse_args)
+    monkeypatch.setattr("runpod_singleton.singleton.RunpodSingletonManager", mocks.manager_class)
+    monkeypatch.setattr("runpod_singleton.singleton.sys.exit", mocks.exit)
+    return mocks
+
+
+@pytest.fixture(scope="session")
+def sample_config() -> Mapping[str, Any]:
+    """
+    Fixture for a sample configuration, built once and read-only so no test
+    can leak changes into another.
+    """
+    return MappingProxyType({
+        const.POD_NAME: "test-singleton-pod",
+        const.IMAGE_NAME: "test-image",
+        const.GPU_TYPES: ("NVIDIA GeForce RTX 3090", "NVIDIA GeForce RTX 4090"),
+        const.GPU_COUNT: 1,
+        const.CONTAINER_DISK_IN_GB: 10,
+    })
+
+
+@pytest.fixture(scope="session")
+def mock_config_path() -> object:
+    """
+    Fixture for a sentinel config path, built once per session. load_config is
+    mocked, so the path is only passed through and compared by identity.
+    """
+    return object()
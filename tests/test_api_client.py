@@ -1,18 +1,47 @@
+import os
+import sys
 import pytest
+import requests
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from runpod.error import QueryError
+
 # Import the stub class (it will be defined in singleton.py later)
 # We need to import it this way initially until the refactoring is complete
-from runpod_singleton.singleton import RunpodApiClient
+from runpod_singleton.singleton import RunpodApiClient, RunpodApiError
+from runpod_singleton import constants as const
 
 
 @pytest.fixture
 def mock_runpod_lib():
-    """Fixture to mock the runpod library."""
+    """Fixture to mock the runpod library, keeping its real error classes."""
+    import runpod.error
+
     with patch("runpod_singleton.singleton.runpod", autospec=True) as mock_lib:
+        mock_lib.error = runpod.error
         yield mock_lib
 
 
+@pytest.fixture(autouse=True)
+def pods_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture to keep the on-disk pod listing cache out of the real temp dir."""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+def test_runpod_sdk_imported_lazily():
+    """Test importing the singleton module does not import the runpod SDK."""
+    code = "import sys, runpod_singleton.singleton; print('runpod' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
 def test_api_client_init(mock_runpod_lib: MagicMock):
     """Test RunpodApiClient initialization sets the API key."""
     api_key = "test_api_key"
@@ -21,19 +50,230 @@ def test_api_client_init(mock_runpod_lib: MagicMock):
     assert client.api_key == api_key
 
 
+def test_api_client_routes_sdk_requests_through_session(mock_runpod_lib: MagicMock):
+    """Test RunpodApiClient installs a pooled session as the SDK's HTTP transport."""
+    client = RunpodApiClient(api_key="test_key")
+    transport = mock_runpod_lib.api.graphql.requests
+
+    with patch.object(client._session, "post") as mock_post:
+        transport.post("https://api.runpod.io/graphql", data="{}", timeout=30)
+
+    mock_post.assert_called_once_with("https://api.runpod.io/graphql", data="{}", timeout=30)
+    adapter = client._session.get_adapter("https://api.runpod.io/graphql")
+    assert adapter._pool_maxsize == const.HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+
+
+def test_api_client_close_restores_sdk_transport(mock_runpod_lib: MagicMock):
+    """Test RunpodApiClient.close closes the session and restores the SDK's transport."""
+    client = RunpodApiClient(api_key="test_key")
+
+    with patch.object(client._session, "close") as mock_close:
+        client.close()
+
+    mock_close.assert_called_once()
+    assert mock_runpod_lib.api.graphql.requests is requests
+
+
+def test_api_client_close_keeps_other_client_transport(mock_runpod_lib: MagicMock):
+    """Test closing a client leaves a newer client's session installed as the SDK's transport."""
+    older = RunpodApiClient(api_key="test_key")
+    newer = RunpodApiClient(api_key="test_key")
+    newer_transport = mock_runpod_lib.api.graphql.requests
+
+    older.close()
+
+    assert mock_runpod_lib.api.graphql.requests is newer_transport
+    newer.close()
+    assert mock_runpod_lib.api.graphql.requests is requests
+
+
 def test_api_client_get_pods(mock_runpod_lib: MagicMock):
-    """Test RunpodApiClient.get_pods calls runpod.get_pods."""
+    """Test RunpodApiClient.get_pods runs the minimal pods GraphQL query."""
     api_key = "test_key"
     client = RunpodApiClient(api_key=api_key)
     expected_pods = [{"id": "pod1"}, {"id": "pod2"}]
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {
+        "data": {"myself": {"pods": expected_pods}}
+    }
+
+    pods = client.get_pods()
+
+    mock_runpod_lib.api.graphql.run_graphql_query.assert_called_once_with(
+        const.GRAPHQL_PODS_QUERY, api_key=api_key
+    )
+    mock_runpod_lib.get_pods.assert_not_called()
+    assert pods == expected_pods
+
+
+def test_api_client_get_pods_falls_back_to_sdk(mock_runpod_lib: MagicMock):
+    """Test RunpodApiClient.get_pods falls back to runpod.get_pods if the minimal query fails."""
+    client = RunpodApiClient(api_key="test_key")
+    expected_pods = [{"id": "pod1"}, {"id": "pod2"}]
+    mock_runpod_lib.api.graphql.run_graphql_query.side_effect = mock_runpod_lib.error.QueryError(
+        'Cannot query field "desiredStatus" on type "Pod".'
+    )
     mock_runpod_lib.get_pods.return_value = expected_pods
 
     pods = client.get_pods()
 
+    mock_runpod_lib.api.graphql.run_graphql_query.assert_called_once()
     mock_runpod_lib.get_pods.assert_called_once()
     assert pods == expected_pods
 
 
+def test_api_client_get_pods_falls_back_on_unexpected_shape(mock_runpod_lib: MagicMock):
+    """Test RunpodApiClient.get_pods falls back to runpod.get_pods if the response shape is unexpected."""
+    client = RunpodApiClient(api_key="test_key")
+    expected_pods = [{"id": "pod1"}]
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {"data": {"myself": None}}
+    mock_runpod_lib.get_pods.return_value = expected_pods
+
+    assert client.get_pods() == expected_pods
+
+
+def test_api_client_get_pods_no_fallback_after_retries_exhausted(
+    mock_sleep: MagicMock, mock_runpod_lib: MagicMock
+):
+    """Test RunpodApiClient.get_pods does not retry via the SDK once the minimal query's retries are spent."""
+    client = RunpodApiClient(api_key="test_key")
+    mock_runpod_lib.api.graphql.run_graphql_query.side_effect = requests.ConnectionError("Connection reset")
+
+    with pytest.raises(RunpodApiError, match="Connection reset"):
+        client.get_pods()
+
+    assert mock_runpod_lib.api.graphql.run_graphql_query.call_count == const.API_RETRIES + 1
+    mock_runpod_lib.get_pods.assert_not_called()
+
+
+def test_api_client_get_pods_no_fallback_on_auth_error(mock_runpod_lib: MagicMock):
+    """Test RunpodApiClient.get_pods raises authentication errors without falling back."""
+    client = RunpodApiClient(api_key="test_key")
+    mock_runpod_lib.api.graphql.run_graphql_query.side_effect = mock_runpod_lib.error.AuthenticationError(
+        "Unauthorized request, please check your API key."
+    )
+
+    with pytest.raises(RunpodApiError, match="Unauthorized"):
+        client.get_pods()
+
+    mock_runpod_lib.api.graphql.run_graphql_query.assert_called_once()
+    mock_runpod_lib.get_pods.assert_not_called()
+
+
+def test_api_client_get_pods_file_cache(mock_runpod_lib: MagicMock, pods_cache_dir: Path):
+    """Test get_pods reuses a listing cached on disk by an earlier client."""
+    pods = [{"id": "pod1", "name": "test-pod", "desiredStatus": "RUNNING", "env": ["SECRET=1"]}]
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {
+        "data": {"myself": {"pods": pods}}
+    }
+
+    first = RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60).get_pods()
+    second = RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60).get_pods()
+
+    assert first == pods
+    assert second == [{"id": "pod1", "name": "test-pod", "desiredStatus": "RUNNING"}]
+    mock_runpod_lib.api.graphql.run_graphql_query.assert_called_once()
+    cache_file = next(pods_cache_dir.glob(f"{const.PODS_FILE_CACHE_DIR_PREFIX}*/{const.PODS_FILE_CACHE_PREFIX}*.json"))
+    assert "SECRET" not in cache_file.read_text()
+    assert cache_file.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_api_client_pods_file_cache_invalidated_on_change(mock_runpod_lib: MagicMock):
+    """Test state-changing calls drop the on-disk pod listing."""
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {
+        "data": {"myself": {"pods": []}}
+    }
+    client = RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60)
+
+    client.get_pods()
+    client.stop_pod("pod1")
+    client.get_pods()
+
+    assert mock_runpod_lib.api.graphql.run_graphql_query.call_count == 2
+
+
+def test_api_client_pods_file_cache_invalidated_by_ttl_zero_client(mock_runpod_lib: MagicMock):
+    """Test a client with the on-disk cache disabled still invalidates it for others."""
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {
+        "data": {"myself": {"pods": []}}
+    }
+
+    RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60).get_pods()
+    RunpodApiClient(api_key="test_key").stop_pod("pod1")
+    RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60).get_pods()
+
+    assert mock_runpod_lib.api.graphql.run_graphql_query.call_count == 2
+
+
+def test_api_client_pods_file_cache_ignores_write_after_invalidation(mock_runpod_lib: MagicMock):
+    """Test a listing fetched while another client changes pod state is not cached."""
+    def query_overlapping_stop(*args, **kwargs):
+        RunpodApiClient(api_key="test_key").stop_pod("pod1")
+        return {"data": {"myself": {"pods": [{"id": "pod1", "desiredStatus": "RUNNING"}]}}}
+
+    mock_runpod_lib.api.graphql.run_graphql_query.side_effect = query_overlapping_stop
+
+    RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60).get_pods()
+    RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60).get_pods()
+
+    assert mock_runpod_lib.api.graphql.run_graphql_query.call_count == 2
+
+
+def test_api_client_pods_file_cache_ttl_zero_writes_nothing(mock_runpod_lib: MagicMock, pods_cache_dir: Path):
+    """Test a client with the on-disk cache disabled leaves no files when no cache exists."""
+    RunpodApiClient(api_key="test_key").stop_pod("pod1")
+
+    assert list(pods_cache_dir.iterdir()) == []
+
+
+def test_api_client_pods_file_cache_ignores_open_directory(mock_runpod_lib: MagicMock):
+    """Test a cache directory accessible to other users is neither read nor written."""
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {
+        "data": {"myself": {"pods": []}}
+    }
+    client = RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60)
+    client.get_pods()
+    client._pods_cache_dir.chmod(0o777)
+
+    client.get_pods()
+
+    assert mock_runpod_lib.api.graphql.run_graphql_query.call_count == 2
+
+
+def test_api_client_pods_file_cache_ignores_other_users_files(
+    mock_runpod_lib: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test a cache owned by another user is not read."""
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {
+        "data": {"myself": {"pods": []}}
+    }
+    client = RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60)
+    client.get_pods()
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(client._pods_cache_path).st_uid + 1)
+
+    client.get_pods()
+
+    assert mock_runpod_lib.api.graphql.run_graphql_query.call_count == 2
+
+
+def test_api_client_pods_file_cache_does_not_follow_symlinks(mock_runpod_lib: MagicMock, tmp_path: Path):
+    """Test the cache is not written through a symlink planted at the temporary file path."""
+    mock_runpod_lib.api.graphql.run_graphql_query.return_value = {
+        "data": {"myself": {"pods": []}}
+    }
+    client = RunpodApiClient(api_key="test_key", pods_file_cache_ttl=60)
+    client._pods_cache_dir.mkdir(mode=0o700)
+    target = tmp_path / "target"
+    target.write_text("untouched")
+    tmp_name = f"{client._pods_cache_path.name}.{os.getpid()}.{threading.get_ident()}"
+    (client._pods_cache_dir / tmp_name).symlink_to(target)
+
+    client.get_pods()
+
+    assert target.read_text() == "untouched"
+    assert not client._pods_cache_path.exists()
+
+
 def test_api_client_get_pod(mock_runpod_lib: MagicMock):
     """Test RunpodApiClient.get_pod calls runpod.get_pod."""
     api_key = "test_key"
@@ -103,3 +343,155 @@ def test_api_client_terminate_pod(mock_runpod_lib: MagicMock):
 
     mock_runpod_lib.terminate_pod.assert_called_once_with(pod_id)
     assert response == expected_response
+
+
+def test_api_client_retries_transient_errors(mock_sleep: MagicMock, mock_runpod_lib: MagicMock):
+    """Test transient API errors are retried with exponential backoff."""
+    client = RunpodApiClient(api_key="test_key")
+    expected_pod = {"id": "pod1"}
+    mock_runpod_lib.get_pod.side_effect = [
+        QueryError("Something went wrong: INTERNAL_SERVER_ERROR"),
+        QueryError("503 Service Unavailable"),
+        expected_pod,
+    ]
+
+    pod = client.get_pod("pod1")
+
+    assert pod == expected_pod
+    assert mock_runpod_lib.get_pod.call_count == 3
+    assert mock_sleep.call_count == 2
+    first_delay = mock_sleep.call_args_list[0].args[0]
+    second_delay = mock_sleep.call_args_list[1].args[0]
+    assert 0.5 <= first_delay <= 0.7
+    assert 1.0 <= second_delay <= 1.2
+
+
+def test_api_client_retries_exhausted(mock_sleep: MagicMock, mock_runpod_lib: MagicMock):
+    """Test the last error is raised, wrapped, once all retries are exhausted."""
+    client = RunpodApiClient(api_key="test_key")
+    error = requests.ConnectionError("Connection reset")
+    mock_runpod_lib.stop_pod.side_effect = error
+
+    with pytest.raises(RunpodApiError, match="Connection reset") as exc_info:
+        client.stop_pod("test_pod_id")
+
+    assert exc_info.value.__cause__ is error
+
+    assert mock_runpod_lib.stop_pod.call_count == 6
+    assert mock_sleep.call_count == 5
+
+
+def test_api_client_unexpected_error_not_retried(mock_sleep: MagicMock, mock_runpod_lib: MagicMock):
+    """Test errors that are not network, HTTP or SDK errors are re-raised as is without retrying."""
+    client = RunpodApiClient(api_key="test_key")
+    mock_runpod_lib.get_pod.side_effect = TypeError("unexpected keyword argument")
+
+    with pytest.raises(TypeError, match="unexpected keyword argument"):
+        client.get_pod("pod1")
+
+    mock_runpod_lib.get_pod.assert_called_once()
+    mock_sleep.assert_not_called()
+    assert client.rate_limiter.in_flight == 0
+
+
+def test_api_client_non_retryable_error(mock_sleep: MagicMock, mock_runpod_lib: MagicMock):
+    """Test capacity errors are raised immediately without retrying."""
+    client = RunpodApiClient(api_key="test_key")
+    mock_runpod_lib.resume_pod.side_effect = QueryError(
+        "There are not enough free GPUs on the host machine to start this pod."
+    )
+
+    with pytest.raises(RunpodApiError, match="not enough free GPUs"):
+        client.resume_pod("test_pod_id", 1)
+
+    mock_runpod_lib.resume_pod.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_api_client_create_pod_retries_only_rate_limits(mock_runpod_lib: MagicMock):
+    """Test create_pod retries rate-limit errors but not other transient errors."""
+    client = RunpodApiClient(api_key="test_key")
+    expected_response = {"id": "new_pod_id"}
+    mock_runpod_lib.create_pod.side_effect = [QueryError("429 Too Many Requests"), expected_response]
+
+    assert client.create_pod(name="new_pod") == expected_response
+    assert mock_runpod_lib.create_pod.call_count == 2
+
+    mock_runpod_lib.create_pod.reset_mock()
+    mock_runpod_lib.create_pod.side_effect = QueryError("502 Bad Gateway")
+
+    with pytest.raises(RunpodApiError, match="502 Bad Gateway"):
+        client.create_pod(name="new_pod")
+    mock_runpod_lib.create_pod.assert_called_once()
+
+
+def test_api_client_create_pod_does_not_retry_id_containing_429(mock_runpod_lib: MagicMock):
+    """Test digits inside an ID in the error message are not taken for a rate limit."""
+    client = RunpodApiClient(api_key="test_key")
+    mock_runpod_lib.create_pod.side_effect = QueryError("Pod ab429cd failed to start")
+
+    with pytest.raises(RunpodApiError, match="ab429cd"):
+        client.create_pod(name="new_pod")
+    mock_runpod_lib.create_pod.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (requests.HTTPError(response=MagicMock(status_code=429)), const.API_ERROR_RATE_LIMIT),
+        (requests.HTTPError(response=MagicMock(status_code=503)), const.API_ERROR_SERVER),
+        (requests.HTTPError(response=MagicMock(status_code=403)), const.API_ERROR_NON_RETRYABLE),
+        (QueryError("Unauthorized request, please check your API key."), const.API_ERROR_NON_RETRYABLE),
+        (QueryError("Specified GPU type is not available"), const.API_ERROR_NON_RETRYABLE),
+        (QueryError("Service not available, try again"), const.API_ERROR_TRANSIENT),
+        (QueryError("429 Too Many Requests"), const.API_ERROR_RATE_LIMIT),
+        (QueryError("Pod 5042abc not ready"), const.API_ERROR_TRANSIENT),
+    ],
+    ids=[
+        "http_429",
+        "http_503",
+        "http_403",
+        "unauthorized_message",
+        "gpu_not_available",
+        "service_not_available",
+        "rate_limit_message",
+        "id_with_status_digits",
+    ],
+)
+def test_api_client_classify_error(mock_runpod_lib: MagicMock, error: Exception, expected: str):
+    """Test errors are classified by HTTP status first, then by word-bounded message patterns."""
+    assert RunpodApiClient._classify_error(error) == expected
+
+
+def test_api_client_classify_authentication_error(mock_runpod_lib: MagicMock):
+    """Test the SDK's authentication error is never retried."""
+    error = mock_runpod_lib.error.AuthenticationError("No API key provided")
+    assert RunpodApiClient._classify_error(error) == const.API_ERROR_NON_RETRYABLE
+
+
+def test_api_client_transport_raises_http_errors(mock_runpod_lib: MagicMock):
+    """Test the session transport raises rate-limit and server error responses."""
+    client = RunpodApiClient(api_key="test_key")
+    transport = mock_runpod_lib.api.graphql.requests
+    response = requests.Response()
+    response.status_code = 429
+
+    with patch.object(client._session, "post", return_value=response):
+        with pytest.raises(requests.HTTPError) as exc_info:
+            transport.post("https://api.runpod.io/graphql", data="{}", timeout=30)
+
+    assert exc_info.value.response.status_code == 429
+
+
+def test_api_client_reports_rate_limits_to_limiter(mock_runpod_lib: MagicMock):
+    """Test rate-limit errors lower the limiter's in-flight cap and successes raise it."""
+    client = RunpodApiClient(api_key="test_key")
+    mock_runpod_lib.get_pod.side_effect = [QueryError("429 Too Many Requests"), {"id": "pod1"}]
+    initial_cap = client.rate_limiter.max_in_flight
+
+    client.get_pod("pod1")
+
+    assert client.rate_limiter.in_flight == 0
+    assert client.rate_limiter.max_in_flight == min(
+        initial_cap, initial_cap * 0.5 + 1
+    )
@@ -0,0 +1,54 @@
+import pytest
+import yaml
+from pathlib import Path
+from unittest.mock import patch
+
+from runpod_singleton import singleton
+from runpod_singleton.singleton import load_config
+
+
+def test_load_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test load_config parses YAML and substitutes !ENV environment variables."""
+    monkeypatch.setenv("TEST_POD_NAME", "env-pod")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "pod_name: !ENV ${TEST_POD_NAME}\n"
+        "gpu_types:\n"
+        "  - NVIDIA GeForce RTX 4090\n"
+        "container_disk_in_gb: 10\n"
+    )
+
+    config = load_config(config_file)
+
+    assert config == {
+        "pod_name": "env-pod",
+        "gpu_types": ["NVIDIA GeForce RTX 4090"],
+        "container_disk_in_gb": 10,
+    }
+
+
+def test_load_config_file_not_found(tmp_path: Path):
+    """Test load_config raises FileNotFoundError for a missing file."""
+    with pytest.raises(FileNotFoundError, match="not found"):
+        load_config(tmp_path / "missing.yaml")
+
+
+def test_load_config_invalid_yaml(tmp_path: Path):
+    """Test load_config raises yaml.YAMLError for invalid YAML."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("pod_name: [unclosed\n")
+
+    with pytest.raises(yaml.YAMLError, match="Invalid YAML"):
+        load_config(config_file)
+
+
+def test_load_config_without_env_skips_interpolation(tmp_path: Path):
+    """Test load_config parses files without env var references directly."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("pod_name: test-pod\ngpu_count: 1\n")
+
+    with patch.object(singleton, "parse_config") as mock_parse:
+        config = load_config(config_file)
+
+    mock_parse.assert_not_called()
+    assert config == {"pod_name": "test-pod", "gpu_count": 1}
@@ -1,139 +1,79 @@
 import pytest
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
 
 # Import the function to test
 from runpod_singleton.singleton import parse_args
 
 
-def test_parse_args_required_only():
-    """Test parsing with only the required config argument."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file]):
-        args = parse_args()
-        assert isinstance(args.config, Path)
-        assert args.config == Path(config_file)
-        assert args.api_key is None
-        assert args.stop is False
-        assert args.terminate is False
-        assert args.debug is False
-
-
-def test_parse_args_api_key():
-    """Test parsing with the --api-key argument."""
-    config_file = "config.yaml"
-    api_key_value = "my_secret_key"
-    with patch.object(sys, "argv", ["script_name", config_file, "--api-key", api_key_value]):
-        args = parse_args()
-        assert args.config == Path(config_file)
-        assert args.api_key == api_key_value
-        assert args.stop is False
-        assert args.terminate is False
-        assert args.debug is False
-
-
-def test_parse_args_stop():
-    """Test parsing with the --stop flag."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file, "--stop"]):
-        args = parse_args()
-        assert args.config == Path(config_file)
-        assert args.api_key is None
-        assert args.stop is True
-        assert args.terminate is False
-        assert args.debug is False
-
-
-def test_parse_args_terminate():
-    """Test parsing with the --terminate flag."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file, "--terminate"]):
-        args = parse_args()
-        assert args.config == Path(config_file)
-        assert args.api_key is None
-        assert args.stop is False
-        assert args.terminate is True
-        assert args.debug is False
-
-
-def test_parse_args_debug():
-    """Test parsing with the --debug flag."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file, "--debug"]):
-        args = parse_args()
-        assert args.config == Path(config_file)
-        assert args.api_key is None
-        assert args.stop is False
-        assert args.terminate is False
-        assert args.debug is True
-
-
-def test_parse_args_all_flags():
-    """Test parsing with a combination of optional arguments."""
-    config_file = "my/path/to/config.yaml"
-    api_key_value = "another_key"
-    with patch.object(
-        sys,
-        "argv",
-        [
-            "script_name",
-            config_file,
-            "--api-key",
-            api_key_value,
-            "--stop",
-            "--debug",
-            "--terminate", # Order shouldn't matter
-        ],
-    ):
-        args = parse_args()
-        assert args.config == Path(config_file)
-        assert args.api_key == api_key_value
-        assert args.stop is True
-        assert args.terminate is True
-        assert args.debug is True
-
-
-def test_parse_args_missing_config():
-    """Test that argparse exits when the required config argument is missing."""
-    with patch.object(sys, "argv", ["script_name", "--debug"]):
-        # Argparse raises SystemExit by default on error
-        with pytest.raises(SystemExit):
-            parse_args()
-
-
-def test_parse_args_count():
-    """Test parsing with the --count flag."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file, "--count"]):
-        args = parse_args()
-        assert args.config == Path(config_file)
-        assert args.api_key is None
-        assert args.count is True
-        assert args.stop is False
-        assert args.terminate is False
-        assert args.debug is False
-
-
-def test_parse_args_count_with_stop_raises_error():
-    """Test that --count and --stop together cause an error."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file, "--count", "--stop"]):
-        with pytest.raises(SystemExit):
-            parse_args()
-
-
-def test_parse_args_count_with_terminate_raises_error():
-    """Test that --count and --terminate together cause an error."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file, "--count", "--terminate"]):
-        with pytest.raises(SystemExit):
-            parse_args()
-
-
-def test_parse_args_count_with_stop_and_terminate_raises_error():
-    """Test that --count, --stop, and --terminate together cause an error."""
-    config_file = "config.yaml"
-    with patch.object(sys, "argv", ["script_name", config_file, "--count", "--stop", "--terminate"]):
-        with pytest.raises(SystemExit):
-            parse_args()
+# Parsed values when only the required config argument is given
+DEFAULT_ARGS: dict[str, Any] = {
+    "config": Path("config.yaml"),
+    "api_key": None,
+    "count": False,
+    "stop": False,
+    "terminate": False,
+    "pods_file_cache_ttl": 0.0,
+    "debug": False,
+}
+
+
+def run_parse_args(monkeypatch: pytest.MonkeyPatch, argv_tail: list[str]) -> dict[str, Any]:
+    """Run parse_args() against `script_name <argv_tail>` and return the parsed values."""
+    monkeypatch.setattr(sys, "argv", ["script_name", *argv_tail])
+    return vars(parse_args())
+
+
+@pytest.mark.parametrize(
+    "argv_tail, overrides",
+    [
+        (["config.yaml"], {}),
+        (["config.yaml", "--api-key", "my_secret_key"], {"api_key": "my_secret_key"}),
+        (["config.yaml", "--stop"], {"stop": True}),
+        (["config.yaml", "--terminate"], {"terminate": True}),
+        (["config.yaml", "--debug"], {"debug": True}),
+        (["config.yaml", "--count"], {"count": True}),
+        (["config.yaml", "--pods-file-cache-ttl", "5"], {"pods_file_cache_ttl": 5.0}),
+        (
+            [
+                "my/path/to/config.yaml",
+                "--api-key",
+                "another_key",
+                "--stop",
+                "--debug",
+                "--terminate", # Order shouldn't matter
+            ],
+            {
+                "config": Path("my/path/to/config.yaml"),
+                "api_key": "another_key",
+                "stop": True,
+                "terminate": True,
+                "debug": True,
+            },
+        ),
+    ],
+    ids=["required_only", "api_key", "stop", "terminate", "debug", "count", "pods_file_cache_ttl", "all_flags"],
+)
+def test_parse_args(monkeypatch: pytest.MonkeyPatch, argv_tail: list[str], overrides: dict[str, Any]):
+    """Test parsing valid argument combinations."""
+    args = run_parse_args(monkeypatch, argv_tail)
+    assert isinstance(args["config"], Path)
+    assert args == {**DEFAULT_ARGS, **overrides}
+
+
+@pytest.mark.parametrize(
+    "argv_tail",
+    [
+        ["--debug"], # Missing required config argument
+        ["config.yaml", "--count", "--stop"],
+        ["config.yaml", "--count", "--terminate"],
+        ["config.yaml", "--count", "--stop", "--terminate"],
+    ],
+    ids=["missing_config", "count_with_stop", "count_with_terminate", "count_with_stop_and_terminate"],
+)
+def test_parse_args_invalid_raises_error(monkeypatch: pytest.MonkeyPatch, argv_tail: list[str]):
+    """Test that argparse exits on missing or conflicting arguments."""
+    # Argparse raises SystemExit by default on error
+    with pytest.raises(SystemExit):
+        run_parse_args(monkeypatch, argv_tail)
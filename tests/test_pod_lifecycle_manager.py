@@ -1,93 +1,108 @@
+from __future__ import annotations
+
 import pytest
 import logging
-from unittest.mock import MagicMock, call, patch
-from typing import Any
+import threading
+from unittest.mock import MagicMock, call, create_autospec, patch
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping
 
 # Import the classes to be tested/mocked
-from runpod_singleton.singleton import RunpodApiClient, PodLifecycleManager
+from runpod_singleton.singleton import RunpodApiClient, RunpodApiError, PodLifecycleManager
 from runpod_singleton import constants as const
 
 
 # --- Fixtures ---
 
-@pytest.fixture
-def mock_api_client() -> MagicMock:
-    """Fixture for a mocked RunpodApiClient."""
-    return MagicMock(spec=RunpodApiClient)
+@pytest.fixture(scope="session")
+def api_client_template() -> MagicMock:
+    """Fixture building the autospec'd RunpodApiClient mock once per session."""
+    return create_autospec(RunpodApiClient, instance=True, spec_set=True)
 
 
 @pytest.fixture
-def mock_logger() -> MagicMock:
-    """Fixture for a mocked Logger."""
-    return MagicMock(spec=logging.Logger)
+def mock_api_client(api_client_template: MagicMock) -> MagicMock:
+    """Fixture for a mocked RunpodApiClient, cleared of calls and configured results."""
+    api_client_template.reset_mock(return_value=True, side_effect=True)
+    return api_client_template
+
+
+class _ListHandler(logging.Handler):
+    """Logging handler that keeps every record it receives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class _FakeClock:
+    """Monotonic clock that only moves when advanced."""
+
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
 
 
 @pytest.fixture
-def sample_config() -> dict[str, Any]:
-    """Fixture for a sample configuration dictionary."""
-    return {
-        const.POD_NAME: "test-singleton-pod",
-        const.IMAGE_NAME: "test-image",
-        const.GPU_TYPES: ["NVIDIA GeForce RTX 3090", "NVIDIA GeForce RTX 4090"],
-        const.GPU_COUNT: 1,
-        const.CONTAINER_DISK_IN_GB: 10,
-    }
+def fake_clock(monkeypatch: pytest.MonkeyPatch, mock_sleep: MagicMock) -> _FakeClock:
+    """Fixture for a fake time.monotonic that `mock_sleep` advances."""
+    clock = _FakeClock()
+    mock_sleep.side_effect = clock.advance
+    monkeypatch.setattr("runpod_singleton.singleton.time.monotonic", clock.monotonic)
+    return clock
 
 
 @pytest.fixture
-def pod_lifecycle_manager(
-    mock_api_client: MagicMock, sample_config: dict[str, Any], mock_logger: MagicMock
-) -> PodLifecycleManager:
-    """Fixture to create a PodLifecycleManager instance with mocks."""
-    return PodLifecycleManager(
-        client=mock_api_client,
-        config=sample_config,
-        logger=mock_logger,
-        stop=False,
-        terminate=False,
-    )
+def plm_logger() -> Iterator[logging.Logger]:
+    """Fixture for a real logger whose records are captured by a _ListHandler."""
+    logger = logging.getLogger("plm_test")
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    yield logger
+    logger.removeHandler(handler)
 
 
 @pytest.fixture
-def pod_lifecycle_manager_stop(
-    mock_api_client: MagicMock, sample_config: dict[str, Any], mock_logger: MagicMock
-) -> PodLifecycleManager:
-    """Fixture for PodLifecycleManager with stop=True."""
-    return PodLifecycleManager(
-        client=mock_api_client,
-        config=sample_config,
-        logger=mock_logger,
-        stop=True,
-        terminate=False,
-    )
+def log_records(plm_logger: logging.Logger) -> list[logging.LogRecord]:
+    """Fixture for the records logged to `plm_logger` during the test."""
+    handler = next(h for h in plm_logger.handlers if isinstance(h, _ListHandler))
+    return handler.records
+
+
+@pytest.fixture(scope="session")
+def gpu_types(sample_config: Mapping[str, Any]) -> tuple[str, ...]:
+    """Fixture for the configured GPU types, in preference order."""
+    return tuple(sample_config[const.GPU_TYPES])
 
 
 @pytest.fixture
-def pod_lifecycle_manager_terminate(
-    mock_api_client: MagicMock, sample_config: dict[str, Any], mock_logger: MagicMock
-) -> PodLifecycleManager:
-    """Fixture for PodLifecycleManager with terminate=True."""
-    return PodLifecycleManager(
-        client=mock_api_client,
-        config=sample_config,
-        logger=mock_logger,
-        stop=False,
-        terminate=True,
-    )
+def manager_factory(
+    mock_api_client: MagicMock, sample_config: Mapping[str, Any], plm_logger: logging.Logger
+) -> Callable[..., PodLifecycleManager]:
+    """Fixture returning a factory for PodLifecycleManager instances with mocks."""
+    def _make(stop: bool = False, terminate: bool = False) -> PodLifecycleManager:
+        return PodLifecycleManager(
+            client=mock_api_client,
+            config=sample_config,
+            logger=plm_logger,
+            stop=stop,
+            terminate=terminate,
+        )
+    return _make
 
 
 @pytest.fixture
-def pod_lifecycle_manager_stop_terminate(
-    mock_api_client: MagicMock, sample_config: dict[str, Any], mock_logger: MagicMock
-) -> PodLifecycleManager:
-    """Fixture for PodLifecycleManager with stop=True and terminate=True."""
-    return PodLifecycleManager(
-        client=mock_api_client,
-        config=sample_config,
-        logger=mock_logger,
-        stop=True,
-        terminate=True,
-    )
+def pod_lifecycle_manager(manager_factory: Callable[..., PodLifecycleManager]) -> PodLifecycleManager:
+    """Fixture to create a PodLifecycleManager instance with mocks."""
+    return manager_factory()
 
 
 # --- Helper Data ---
@@ -97,51 +112,132 @@ POD_ID_2 = "pod_id_2"
 POD_NAME = "test-singleton-pod"
 OTHER_POD_NAME = "other-pod"
 
-RUNNING_POD = {
+# Read-only so no test can leak changes into another; build variants with {**POD, ...}
+RUNNING_POD = MappingProxyType({
     const.POD_ID: POD_ID_1,
     const.POD_NAME_API: POD_NAME,
     const.POD_STATUS: const.POD_STATUS_RUNNING,
     const.GPU_COUNT: 1,
-}
-STOPPED_POD = {
+})
+STOPPED_POD = MappingProxyType({
     const.POD_ID: POD_ID_1,
     const.POD_NAME_API: POD_NAME,
     const.POD_STATUS: const.POD_STATUS_EXITED,
     const.GPU_COUNT: 0,
-}
-OTHER_RUNNING_POD = {
+})
+OTHER_RUNNING_POD = MappingProxyType({
     const.POD_ID: POD_ID_2,
     const.POD_NAME_API: OTHER_POD_NAME,
     const.POD_STATUS: const.POD_STATUS_RUNNING,
     const.GPU_COUNT: 1,
-}
-MATCHING_STOPPED_POD_2 = {
+})
+MATCHING_STOPPED_POD_2 = MappingProxyType({
     const.POD_ID: POD_ID_2,
     const.POD_NAME_API: POD_NAME,
     const.POD_STATUS: const.POD_STATUS_EXITED,
     const.GPU_COUNT: 0,
-}
+})
+
+# Pod lists returned by the mocked get_pods(); tuples so tests share them safely
+MATCHING_PODS = (RUNNING_POD, MATCHING_STOPPED_POD_2)
+ALL_PODS = (RUNNING_POD, OTHER_RUNNING_POD, MATCHING_STOPPED_POD_2)
+
+# Expected single-argument call (stop_pod/get_pod) for the first pod ID
+CALL_POD_1 = call(POD_ID_1)
+
+
+def _partitioned(*pods: Mapping[str, Any]) -> dict[str, list[Mapping[str, Any]]]:
+    """Builds a find_pods_by_name_partitioned() result from matching pods."""
+    return {
+        "running": [p for p in pods if p[const.POD_STATUS] == const.POD_STATUS_RUNNING],
+        "all_matching": list(pods),
+    }
+
+
+def _called_pod_ids(mock: MagicMock) -> set[str]:
+    """Returns the pod IDs a per-pod API mock was called with, ignoring call order."""
+    return {c.args[0] for c in mock.call_args_list}
+
+
+def _logged_errors(records: list[logging.LogRecord]) -> list[tuple[Any, tuple[Any, ...]]]:
+    """Returns the (msg, args) of each ERROR record, for comparing against log calls."""
+    return [(r.msg, r.args) for r in records if r.levelno == logging.ERROR]
+
+
+def _expected_create_args(cfg: Mapping[str, Any], gpu_type: str) -> dict[str, Any]:
+    """Builds the create_pod() kwargs expected for a config and GPU type."""
+    return {
+        "name": cfg[const.POD_NAME],
+        "image_name": cfg[const.IMAGE_NAME],
+        "gpu_type_id": gpu_type,
+        "gpu_count": cfg[const.GPU_COUNT],
+        "container_disk_in_gb": cfg[const.CONTAINER_DISK_IN_GB],
+        "cloud_type": const.DEFAULT_CLOUD_TYPE,
+        "support_public_ip": const.DEFAULT_SUPPORT_PUBLIC_IP,
+        "start_ssh": const.DEFAULT_START_SSH,
+        "volume_in_gb": const.DEFAULT_VOLUME_IN_GB,
+        "min_vcpu_count": const.DEFAULT_MIN_VCPU_COUNT,
+        "min_memory_in_gb": const.DEFAULT_MIN_MEMORY_IN_GB,
+        "docker_args": const.DEFAULT_DOCKER_ARGS,
+        "volume_mount_path": const.DEFAULT_VOLUME_MOUNT_PATH,
+    }
 
 
 # --- Test Cases ---
 
 def test_init(
-    mock_api_client: MagicMock, sample_config: dict[str, Any], mock_logger: MagicMock
+    mock_api_client: MagicMock, sample_config: Mapping[str, Any], plm_logger: logging.Logger
 ):
     """Test PodLifecycleManager initialization."""
     manager = PodLifecycleManager(
         client=mock_api_client,
         config=sample_config,
-        logger=mock_logger,
+        logger=plm_logger,
         stop=True,
         terminate=False,
     )
     assert manager.client is mock_api_client
     assert manager.config is sample_config
-    assert manager.log is mock_logger
+    assert manager.log is plm_logger
     assert manager.stop is True
     assert manager.terminate is False
     assert manager.pod_name == sample_config[const.POD_NAME]
+    assert manager.pod_names == frozenset({sample_config[const.POD_NAME]})
+
+
+def test_init_resolves_setting_defaults(
+    mock_api_client: MagicMock, sample_config: Mapping[str, Any], plm_logger: logging.Logger
+):
+    """Test PodLifecycleManager applies defaults for unset settings and honors configured ones."""
+    config = {**sample_config, const.CREATE_GPU_RETRIES: 3}
+    manager = PodLifecycleManager(
+        client=mock_api_client, config=config, logger=plm_logger, stop=False, terminate=False
+    )
+    assert manager.create_retries == 3
+    assert manager.create_wait == const.DEFAULT_CREATE_RETRY_WAIT_SECONDS
+    assert manager._create_pod_kwargs("gpu_id")[const.CLOUD_TYPE] == const.DEFAULT_CLOUD_TYPE
+
+
+def test_create_pod_attempt_uses_current_attributes(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test create_pod() receives attribute values changed after construction."""
+    pod_lifecycle_manager.gpu_count = 4
+    pod_lifecycle_manager.pod_name = "renamed-pod"
+    mock_api_client.create_pod.return_value = {"id": "new_pod_id"}
+
+    pod_lifecycle_manager._create_pod_attempt("gpu_id")
+
+    create_kwargs = mock_api_client.create_pod.call_args.kwargs
+    assert create_kwargs[const.GPU_COUNT] == 4
+    assert create_kwargs["name"] == "renamed-pod"
+
+
+def test_set_cleanup_flags(pod_lifecycle_manager: PodLifecycleManager):
+    """Test set_cleanup_flags updates the stop and terminate flags."""
+    pod_lifecycle_manager.set_cleanup_flags(stop=True, terminate=True)
+    assert pod_lifecycle_manager.stop is True
+    assert pod_lifecycle_manager.terminate is True
 
 
 def test_get_all_pods_from_api(
@@ -156,17 +252,62 @@ def test_get_all_pods_from_api(
 
 
 def test_get_all_pods_from_api_failure(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
     """Test _get_all_pods_from_api returns None and logs error on API failure."""
     error_message = "API connection failed"
-    mock_api_client.get_pods.side_effect = Exception(error_message)
+    error = RunpodApiError(error_message)
+    mock_api_client.get_pods.side_effect = error
     pods = pod_lifecycle_manager._get_all_pods_from_api()
     mock_api_client.get_pods.assert_called_once()
     assert pods is None
-    mock_logger.error.assert_called_once_with(
-        f"Failed to retrieve pods from RunPod API: {error_message}"
+    assert _logged_errors(log_records) == [
+        ("Failed to retrieve pods from RunPod API: %s", (error,))
+    ]
+
+
+def test_get_all_pods_from_api_uses_cache(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test _get_all_pods_from_api reuses the cached pod list within the TTL."""
+    expected_pods = [RUNNING_POD, OTHER_RUNNING_POD]
+    mock_api_client.get_pods.return_value = expected_pods
+    first = pod_lifecycle_manager._get_all_pods_from_api()
+    second = pod_lifecycle_manager._get_all_pods_from_api()
+    mock_api_client.get_pods.assert_called_once()
+    assert first == second == expected_pods
+
+
+def test_get_all_pods_from_api_cache_disabled(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test _get_all_pods_from_api always calls the API when the TTL is 0."""
+    pod_lifecycle_manager.pods_cache_ttl = 0
+    mock_api_client.get_pods.return_value = [RUNNING_POD]
+    pod_lifecycle_manager._get_all_pods_from_api()
+    pod_lifecycle_manager._get_all_pods_from_api()
+    assert mock_api_client.get_pods.call_count == 2
+
+
+def test_get_all_pods_from_api_cache_invalidated_by_terminate(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test terminating a pod discards the cached pod list."""
+    mock_api_client.get_pods.return_value = [RUNNING_POD]
+    pod_lifecycle_manager._get_all_pods_from_api()
+    pod_lifecycle_manager._terminate_pod_silently(POD_ID_1)
+    pod_lifecycle_manager._get_all_pods_from_api()
+    assert mock_api_client.get_pods.call_count == 2
+
+
+def test_filter_by_name(pod_lifecycle_manager: PodLifecycleManager):
+    """Test _filter_by_name yields all matches from one list, in order."""
+    matching = pod_lifecycle_manager._filter_by_name(
+        [OTHER_RUNNING_POD, RUNNING_POD, MATCHING_STOPPED_POD_2]
     )
+    assert list(matching) == [RUNNING_POD, MATCHING_STOPPED_POD_2]
+
+    assert list(pod_lifecycle_manager._filter_by_name([OTHER_RUNNING_POD])) == []
 
 
 def test_find_first_pod_by_name_found(
@@ -190,65 +331,53 @@ def test_find_first_pod_by_name_not_found(
 
 
 def test_find_first_pod_by_name_api_failure(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
     """Test find_first_pod_by_name returns None when API fails."""
     error_message = "API connection failed during find first"
-    mock_api_client.get_pods.side_effect = Exception(error_message)
+    error = RunpodApiError(error_message)
+    mock_api_client.get_pods.side_effect = error
     found_pod = pod_lifecycle_manager.find_first_pod_by_name()
     mock_api_client.get_pods.assert_called_once()
     assert found_pod is None
-    mock_logger.error.assert_any_call(
-        f"Failed to retrieve pods from RunPod API: {error_message}"
-    )
-    mock_logger.error.assert_any_call(
-        "API call to get pods failed. Cannot search for pod."
-    )
+    assert ("Failed to retrieve pods from RunPod API: %s", (error,)) in _logged_errors(log_records)
+    assert ("API call to get pods failed. Cannot search for pod.", ()) in _logged_errors(log_records)
 
 
-def test_find_all_pods_by_name_found(
+def test_find_pods_by_name_partitioned(
     pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
 ):
-    """Test find_all_pods_by_name finds all matching pods."""
-    mock_api_client.get_pods.return_value = [
-        RUNNING_POD,
-        OTHER_RUNNING_POD,
-        MATCHING_STOPPED_POD_2,
-    ]
-    found_pods = pod_lifecycle_manager.find_all_pods_by_name()
+    """Test find_pods_by_name_partitioned splits matching pods by status."""
+    mock_api_client.get_pods.return_value = ALL_PODS
+    partitioned = pod_lifecycle_manager.find_pods_by_name_partitioned()
     mock_api_client.get_pods.assert_called_once()
-    assert len(found_pods) == 2
-    assert RUNNING_POD in found_pods
-    assert MATCHING_STOPPED_POD_2 in found_pods
+    assert partitioned == _partitioned(*MATCHING_PODS)
 
 
-def test_find_all_pods_by_name_not_found(
+def test_find_pods_by_name_partitioned_not_found(
     pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
 ):
-    """Test find_all_pods_by_name returns empty list when no match."""
+    """Test find_pods_by_name_partitioned returns empty lists when no match."""
     mock_api_client.get_pods.return_value = [OTHER_RUNNING_POD]
-    found_pods = pod_lifecycle_manager.find_all_pods_by_name()
+    partitioned = pod_lifecycle_manager.find_pods_by_name_partitioned()
     mock_api_client.get_pods.assert_called_once()
-    assert found_pods == []
+    assert partitioned == _partitioned()
 
 
-def test_find_all_pods_by_name_api_failure(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+def test_find_pods_by_name_partitioned_api_failure(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
-    """Test find_all_pods_by_name returns None when API fails."""
+    """Test find_pods_by_name_partitioned returns None when API fails."""
     error_message = "API connection failed during find all"
-    mock_api_client.get_pods.side_effect = Exception(error_message)
-    found_pods = pod_lifecycle_manager.find_all_pods_by_name()
+    error = RunpodApiError(error_message)
+    mock_api_client.get_pods.side_effect = error
+    partitioned = pod_lifecycle_manager.find_pods_by_name_partitioned()
     mock_api_client.get_pods.assert_called_once()
-    assert found_pods is None
+    assert partitioned is None
     # Check that the error from _get_all_pods_from_api was logged
-    mock_logger.error.assert_any_call(
-        f"Failed to retrieve pods from RunPod API: {error_message}"
-    )
-    # Check that the error from find_all_pods_by_name itself was logged
-    mock_logger.error.assert_any_call(
-        "API call to get pods failed. Cannot find matching pods."
-    )
+    assert ("Failed to retrieve pods from RunPod API: %s", (error,)) in _logged_errors(log_records)
+    # Check that the error from find_pods_by_name_partitioned itself was logged
+    assert ("API call to get pods failed. Cannot find matching pods.", ()) in _logged_errors(log_records)
 
 
 # --- manage() Tests ---
@@ -267,10 +396,47 @@ def test_manage_pod_exists_running(
     assert result == RUNNING_POD[const.POD_ID]
 
 
+def test_manage_pod_exists_starting_waits_without_resume(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test manage() waits for a CREATED pod to reach RUNNING instead of resuming it."""
+    mock_api_client.get_pods.return_value = [{**RUNNING_POD, const.POD_STATUS: const.POD_STATUS_CREATED}]
+    mock_api_client.get_pod.return_value = RUNNING_POD
+
+    result = pod_lifecycle_manager.manage()
+
+    mock_api_client.get_pod.assert_called_once_with(POD_ID_1)
+    mock_api_client.resume_pod.assert_not_called()
+    mock_api_client.create_pod.assert_not_called()
+    mock_api_client.terminate_pod.assert_not_called()
+    assert result == POD_ID_1
+
+
+def test_manage_pod_exists_terminated_creates_new(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: Mapping[str, Any]
+):
+    """Test manage() creates a new pod without resuming a TERMINATED one."""
+    mock_api_client.get_pods.return_value = [{**STOPPED_POD, const.POD_STATUS: const.POD_STATUS_TERMINATED}]
+    created_pod_id = "new_pod_id"
+    mock_api_client.create_pod.return_value = {"id": created_pod_id}
+    mock_api_client.get_pod.return_value = {
+        const.POD_ID: created_pod_id,
+        const.POD_NAME_API: sample_config[const.POD_NAME],
+        const.POD_STATUS: const.POD_STATUS_RUNNING,
+    }
+
+    result = pod_lifecycle_manager.manage()
+
+    mock_api_client.resume_pod.assert_not_called()
+    mock_api_client.terminate_pod.assert_not_called()
+    mock_api_client.create_pod.assert_called_once()
+    assert result == created_pod_id
+
+
 def test_manage_pod_exists_stopped_resumes_successfully(
     pod_lifecycle_manager: PodLifecycleManager,
     mock_api_client: MagicMock,
-    sample_config: dict[str, Any],
+    sample_config: Mapping[str, Any],
 ):
     """Test manage() when a stopped pod exists and resumes successfully."""
     mock_api_client.get_pods.return_value = [STOPPED_POD]
@@ -290,68 +456,55 @@ def test_manage_pod_exists_stopped_resumes_successfully(
     assert result == STOPPED_POD[const.POD_ID]
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
-def test_manage_pod_exists_stopped_resume_fails_api_error_creates_new(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: dict[str, Any]
+def test_manage_unexpected_error_propagates(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
 ):
-    """Test manage() terminates and creates new pod if resume fails (API error)."""
-    gpu_type_1 = sample_config[const.GPU_TYPES][0]
+    """Test manage() lets errors other than RunpodApiError propagate."""
     mock_api_client.get_pods.return_value = [STOPPED_POD]
-    mock_api_client.resume_pod.side_effect = Exception("API Error") # Simulate resume failure
+    mock_api_client.resume_pod.side_effect = TypeError("unexpected")
 
-    # Mock successful creation after resume failure
-    new_pod_id = "new_pod_after_fail"
-    mock_api_client.create_pod.return_value = {"id": new_pod_id}
-    mock_api_client.get_pod.return_value = { # Mock validation call for the new pod
-        const.POD_ID: new_pod_id,
-        const.POD_NAME_API: sample_config[const.POD_NAME],
-        const.POD_STATUS: const.POD_STATUS_RUNNING,
-    }
-
-    result = pod_lifecycle_manager.manage()
+    with pytest.raises(TypeError, match="unexpected"):
+        pod_lifecycle_manager.manage()
 
-    # Assertions for failed resume part
-    mock_api_client.get_pods.assert_called_once()
-    mock_api_client.resume_pod.assert_called_once_with(POD_ID_1, gpu_count=sample_config[const.GPU_COUNT])
-    mock_api_client.terminate_pod.assert_called_once_with(POD_ID_1) # Should terminate failed pod
-
-    # Assertions for successful creation part
-    expected_create_args = {
-        "name": sample_config[const.POD_NAME], "image_name": sample_config[const.IMAGE_NAME], "gpu_type_id": gpu_type_1,
-        "gpu_count": sample_config[const.GPU_COUNT], "container_disk_in_gb": sample_config[const.CONTAINER_DISK_IN_GB],
-        "cloud_type": const.DEFAULT_CLOUD_TYPE, "support_public_ip": const.DEFAULT_SUPPORT_PUBLIC_IP, "start_ssh": const.DEFAULT_START_SSH,
-        "volume_in_gb": const.DEFAULT_VOLUME_IN_GB, "min_vcpu_count": const.DEFAULT_MIN_VCPU_COUNT, "min_memory_in_gb": const.DEFAULT_MIN_MEMORY_IN_GB,
-        "docker_args": const.DEFAULT_DOCKER_ARGS, "volume_mount_path": const.DEFAULT_VOLUME_MOUNT_PATH,
-    }
-    mock_api_client.create_pod.assert_called_once_with(**expected_create_args)
-    # get_pod should be called once for the new pod validation
-    mock_api_client.get_pod.assert_called_once_with(new_pod_id)
-
-    assert result == new_pod_id
+    mock_api_client.create_pod.assert_not_called()
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
-def test_manage_pod_exists_stopped_resume_fails_validation_creates_new(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: dict[str, Any]
+@pytest.mark.parametrize(
+    "resume_error",
+    [True, False],
+    ids=["api_error", "validation_fails"],
+)
+def test_manage_pod_exists_stopped_resume_fails_creates_new(
+    pod_lifecycle_manager: PodLifecycleManager,
+    mock_api_client: MagicMock,
+    sample_config: Mapping[str, Any],
+    gpu_types: tuple[str, ...],
+    resume_error: bool,
 ):
-    """Test manage() terminates and creates new pod if resume validation fails."""
-    gpu_type_1 = sample_config[const.GPU_TYPES][0]
+    """Test manage() terminates and creates new pod if resume fails (API error or validation)."""
+    gpu_type_1 = gpu_types[0]
     mock_api_client.get_pods.return_value = [STOPPED_POD]
-    mock_api_client.resume_pod.return_value = {"id": POD_ID_1, "desiredStatus": "RESTARTING"} # API returns intermediate status
-    # Mock get_pod called by _handle_existing_pod shows it's still not running
-    mock_get_pod_validation_fail = {**STOPPED_POD, const.POD_STATUS: "RESTARTING"}
 
     # Mock successful creation after resume failure
-    new_pod_id = "new_pod_after_fail_2"
-    mock_create_pod_success = {"id": new_pod_id}
+    new_pod_id = "new_pod_after_fail"
+    mock_api_client.create_pod.return_value = {"id": new_pod_id}
     mock_get_pod_validation_success = { # Mock validation call for the new pod
         const.POD_ID: new_pod_id,
         const.POD_NAME_API: sample_config[const.POD_NAME],
         const.POD_STATUS: const.POD_STATUS_RUNNING,
     }
-    # get_pod will be called twice: once for resume validation (fail), once for create validation (success)
-    mock_api_client.get_pod.side_effect = [mock_get_pod_validation_fail, mock_get_pod_validation_success]
-    mock_api_client.create_pod.return_value = mock_create_pod_success
+    if resume_error:
+        mock_api_client.resume_pod.side_effect = RunpodApiError("API Error") # Simulate resume failure
+        validations = {new_pod_id: mock_get_pod_validation_success}
+        expected_get_pod_calls = [call(new_pod_id)]
+    else:
+        pod_lifecycle_manager.validate_poll_timeout = 0 # Check status only once
+        mock_api_client.resume_pod.return_value = {"id": POD_ID_1, "desiredStatus": "RESTARTING"} # API returns intermediate status
+        # get_pod is called twice: once for resume validation (fail), once for create validation (success)
+        mock_get_pod_validation_fail = {**STOPPED_POD, const.POD_STATUS: "RESTARTING"}
+        validations = {POD_ID_1: mock_get_pod_validation_fail, new_pod_id: mock_get_pod_validation_success}
+        expected_get_pod_calls = [CALL_POD_1, call(new_pod_id)]
+    mock_api_client.get_pod.side_effect = validations.__getitem__
 
     result = pod_lifecycle_manager.manage()
 
@@ -361,27 +514,18 @@ def test_manage_pod_exists_stopped_resume_fails_validation_creates_new(
     mock_api_client.terminate_pod.assert_called_once_with(POD_ID_1) # Should terminate failed pod
 
     # Assertions for successful creation part
-    expected_create_args = {
-        "name": sample_config[const.POD_NAME], "image_name": sample_config[const.IMAGE_NAME], "gpu_type_id": gpu_type_1,
-        "gpu_count": sample_config[const.GPU_COUNT], "container_disk_in_gb": sample_config[const.CONTAINER_DISK_IN_GB],
-        "cloud_type": const.DEFAULT_CLOUD_TYPE, "support_public_ip": const.DEFAULT_SUPPORT_PUBLIC_IP, "start_ssh": const.DEFAULT_START_SSH,
-        "volume_in_gb": const.DEFAULT_VOLUME_IN_GB, "min_vcpu_count": const.DEFAULT_MIN_VCPU_COUNT, "min_memory_in_gb": const.DEFAULT_MIN_MEMORY_IN_GB,
-        "docker_args": const.DEFAULT_DOCKER_ARGS, "volume_mount_path": const.DEFAULT_VOLUME_MOUNT_PATH,
-    }
+    expected_create_args = _expected_create_args(sample_config, gpu_type_1)
     mock_api_client.create_pod.assert_called_once_with(**expected_create_args)
-    # get_pod should be called twice
-    assert mock_api_client.get_pod.call_count == 2
-    mock_api_client.get_pod.assert_has_calls([call(POD_ID_1), call(new_pod_id)])
+    assert mock_api_client.get_pod.call_args_list == expected_get_pod_calls
 
     assert result == new_pod_id
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
 def test_manage_no_pod_creates_successfully(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: dict[str, Any]
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: Mapping[str, Any], gpu_types: tuple[str, ...]
 ):
     """Test manage() creates a pod when none exists."""
-    gpu_type_1, gpu_type_2 = sample_config[const.GPU_TYPES]
+    gpu_type_1, gpu_type_2 = gpu_types
     mock_api_client.get_pods.return_value = [] # No existing pods
     # Simulate create_pod succeeding on the first try
     created_pod_id = "new_pod_id"
@@ -398,41 +542,52 @@ def test_manage_no_pod_creates_successfully(
     mock_api_client.get_pods.assert_called_once()
     mock_api_client.resume_pod.assert_not_called()
     # Check create_pod was called with correct args for the first GPU type
-    expected_create_args = {
-        "name": sample_config[const.POD_NAME],
-        "image_name": sample_config[const.IMAGE_NAME],
-        "gpu_type_id": gpu_type_1,
-        "gpu_count": sample_config[const.GPU_COUNT],
-        "container_disk_in_gb": sample_config[const.CONTAINER_DISK_IN_GB],
-        # Add defaults or other expected args based on implementation
-        "cloud_type": const.DEFAULT_CLOUD_TYPE,
-        "support_public_ip": const.DEFAULT_SUPPORT_PUBLIC_IP,
-        "start_ssh": const.DEFAULT_START_SSH,
-        "volume_in_gb": const.DEFAULT_VOLUME_IN_GB,
-        "min_vcpu_count": const.DEFAULT_MIN_VCPU_COUNT,
-        "min_memory_in_gb": const.DEFAULT_MIN_MEMORY_IN_GB,
-        "docker_args": const.DEFAULT_DOCKER_ARGS,
-        "volume_mount_path": const.DEFAULT_VOLUME_MOUNT_PATH,
-    }
+    expected_create_args = _expected_create_args(sample_config, gpu_type_1)
     mock_api_client.create_pod.assert_called_once_with(**expected_create_args)
     mock_api_client.get_pod.assert_called_once_with(created_pod_id) # Validation call
     mock_api_client.terminate_pod.assert_not_called()
     assert result == created_pod_id
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
+def test_create_pod_attempt_includes_only_configured_optional_params(
+    mock_api_client: MagicMock, sample_config: Mapping[str, Any], plm_logger: logging.Logger
+):
+    """Test _create_pod_attempt passes optional parameters only when set in config."""
+    config = {**sample_config, const.PORTS: "8888/http", const.DATA_CENTER_ID: None}
+    manager = PodLifecycleManager(
+        client=mock_api_client, config=config, logger=plm_logger, stop=False, terminate=False
+    )
+    mock_api_client.create_pod.return_value = {"id": "new_pod_id"}
+
+    assert manager._create_pod_attempt("gpu_id") == "new_pod_id"
+
+    create_kwargs = mock_api_client.create_pod.call_args.kwargs
+    assert create_kwargs["gpu_type_id"] == "gpu_id"
+    assert create_kwargs[const.PORTS] == "8888/http"
+    assert const.DATA_CENTER_ID not in create_kwargs
+    assert const.ENV not in create_kwargs
+
+
 def test_manage_no_pod_creation_fails_first_succeeds_second(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: dict[str, Any]
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: Mapping[str, Any], gpu_types: tuple[str, ...]
 ):
     """Test manage() tries next GPU if first create fails, succeeds on second."""
-    gpu_type_1, gpu_type_2 = sample_config[const.GPU_TYPES]
+    gpu_type_1, gpu_type_2 = gpu_types
     mock_api_client.get_pods.return_value = [] # No existing pods
     # Simulate create_pod failing on first GPU, succeeding on second
     created_pod_id = "new_pod_id_2"
-    mock_api_client.create_pod.side_effect = [
-        Exception("GPU unavailable"), # Fails for gpu_type_1
-        {"id": created_pod_id}        # Succeeds for gpu_type_2
-    ]
+    create_results = {
+        gpu_type_1: RunpodApiError("GPU unavailable"),
+        gpu_type_2: {"id": created_pod_id},
+    }
+
+    def create_side_effect(**kwargs: Any) -> dict[str, Any]:
+        result = create_results[kwargs["gpu_type_id"]]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    mock_api_client.create_pod.side_effect = create_side_effect
     # Simulate get_pod for validation succeeding
     mock_api_client.get_pod.return_value = {
         const.POD_ID: created_pod_id,
@@ -445,21 +600,9 @@ def test_manage_no_pod_creation_fails_first_succeeds_second(
     mock_api_client.get_pods.assert_called_once()
     assert mock_api_client.create_pod.call_count == 2
     # Check first call args
-    expected_create_args_1 = {
-        "name": sample_config[const.POD_NAME], "image_name": sample_config[const.IMAGE_NAME], "gpu_type_id": gpu_type_1,
-        "gpu_count": sample_config[const.GPU_COUNT], "container_disk_in_gb": sample_config[const.CONTAINER_DISK_IN_GB],
-        "cloud_type": const.DEFAULT_CLOUD_TYPE, "support_public_ip": const.DEFAULT_SUPPORT_PUBLIC_IP, "start_ssh": const.DEFAULT_START_SSH,
-        "volume_in_gb": const.DEFAULT_VOLUME_IN_GB, "min_vcpu_count": const.DEFAULT_MIN_VCPU_COUNT, "min_memory_in_gb": const.DEFAULT_MIN_MEMORY_IN_GB,
-        "docker_args": const.DEFAULT_DOCKER_ARGS, "volume_mount_path": const.DEFAULT_VOLUME_MOUNT_PATH,
-    }
+    expected_create_args_1 = _expected_create_args(sample_config, gpu_type_1)
     # Check second call args
-    expected_create_args_2 = {
-        "name": sample_config[const.POD_NAME], "image_name": sample_config[const.IMAGE_NAME], "gpu_type_id": gpu_type_2,
-        "gpu_count": sample_config[const.GPU_COUNT], "container_disk_in_gb": sample_config[const.CONTAINER_DISK_IN_GB],
-        "cloud_type": const.DEFAULT_CLOUD_TYPE, "support_public_ip": const.DEFAULT_SUPPORT_PUBLIC_IP, "start_ssh": const.DEFAULT_START_SSH,
-        "volume_in_gb": const.DEFAULT_VOLUME_IN_GB, "min_vcpu_count": const.DEFAULT_MIN_VCPU_COUNT, "min_memory_in_gb": const.DEFAULT_MIN_MEMORY_IN_GB,
-        "docker_args": const.DEFAULT_DOCKER_ARGS, "volume_mount_path": const.DEFAULT_VOLUME_MOUNT_PATH,
-    }
+    expected_create_args_2 = _expected_create_args(sample_config, gpu_type_2)
     mock_api_client.create_pod.assert_has_calls([
         call(**expected_create_args_1),
         call(**expected_create_args_2)
@@ -469,31 +612,77 @@ def test_manage_no_pod_creation_fails_first_succeeds_second(
     assert result == created_pod_id
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
 def test_manage_no_pod_creation_fails_all_gpus(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: dict[str, Any]
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, gpu_types: tuple[str, ...]
 ):
     """Test manage() returns False if all GPU creation attempts fail."""
     mock_api_client.get_pods.return_value = [] # No existing pods
     # Simulate create_pod failing for all GPUs
-    mock_api_client.create_pod.side_effect = Exception("GPU unavailable")
+    mock_api_client.create_pod.side_effect = RunpodApiError("GPU unavailable")
 
     result = pod_lifecycle_manager.manage()
 
     mock_api_client.get_pods.assert_called_once()
-    assert mock_api_client.create_pod.call_count == len(sample_config[const.GPU_TYPES]) # Called for each GPU type
+    assert mock_api_client.create_pod.call_count == len(gpu_types) # Called for each GPU type
     mock_api_client.get_pod.assert_not_called() # No validation needed
     mock_api_client.terminate_pod.assert_not_called()
     assert result is None
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
+def test_manage_no_pod_create_returns_none_tries_next_gpu(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: Mapping[str, Any], gpu_types: tuple[str, ...]
+):
+    """Test manage() treats an empty create_pod response as a failed attempt and tries the next GPU."""
+    gpu_type_1, gpu_type_2 = gpu_types
+    mock_api_client.get_pods.return_value = []
+    created_pod_id = "new_pod_id_2"
+    mock_api_client.create_pod.side_effect = lambda **kwargs: (
+        None if kwargs["gpu_type_id"] == gpu_type_1 else {"id": created_pod_id}
+    )
+    mock_api_client.get_pod.return_value = {
+        const.POD_ID: created_pod_id,
+        const.POD_NAME_API: sample_config[const.POD_NAME],
+        const.POD_STATUS: const.POD_STATUS_RUNNING,
+    }
+
+    result = pod_lifecycle_manager.manage()
+
+    assert mock_api_client.create_pod.call_count == 2
+    mock_api_client.terminate_pod.assert_not_called()
+    assert result == created_pod_id
+
+
+def test_validate_new_pod_get_pod_returns_none_terminates(
+    mock_sleep: MagicMock, fake_clock: _FakeClock, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test _validate_new_pod fails and terminates the pod when get_pod returns no details."""
+    mock_api_client.get_pod.return_value = None
+
+    result = pod_lifecycle_manager._validate_new_pod(POD_ID_1)
+
+    assert result is False
+    mock_api_client.terminate_pod.assert_called_once_with(POD_ID_1)
+
+
+def test_validate_new_pod_unexpected_error_terminates(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test _validate_new_pod terminates the pod on errors other than RunpodApiError."""
+    mock_api_client.get_pod.side_effect = ValueError("malformed response")
+
+    result = pod_lifecycle_manager._validate_new_pod(POD_ID_1)
+
+    assert result is False
+    mock_api_client.terminate_pod.assert_called_once_with(POD_ID_1)
+
+
 def test_manage_no_pod_creation_succeeds_but_validation_fails(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: dict[str, Any]
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, gpu_types: tuple[str, ...]
 ):
     """Test manage() terminates pod if creation succeeds but validation fails."""
     # We only want one failure here, so limit to first GPU
-    pod_lifecycle_manager.gpu_types = [sample_config[const.GPU_TYPES][0]]
+    pod_lifecycle_manager.gpu_types = [gpu_types[0]]
+    pod_lifecycle_manager.validate_poll_timeout = 0 # Check status only once
     mock_api_client.get_pods.return_value = [] # No existing pods
     created_pod_id = "new_pod_id"
     mock_api_client.create_pod.return_value = {"id": created_pod_id}
@@ -513,24 +702,20 @@ def test_manage_no_pod_creation_succeeds_but_validation_fails(
     assert result is None
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
 def test_manage_api_failure_during_find(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
     """Test manage() returns False if the initial get_pods API call fails."""
     error_message = "Initial API Error during manage"
     # Simulate get_pods failing initially when called by find_first_pod_by_name
-    mock_api_client.get_pods.side_effect = Exception(error_message)
+    error = RunpodApiError(error_message)
+    mock_api_client.get_pods.side_effect = error
 
     result = pod_lifecycle_manager.manage()
 
     mock_api_client.get_pods.assert_called_once()
-    mock_logger.error.assert_any_call(
-        "API call to list pods failed during search. Cannot manage pod state."
-    )
-    mock_logger.error.assert_any_call(
-        f"Failed to retrieve pods from RunPod API: {error_message}"
-    )
+    assert ("API call to list pods failed during search. Cannot manage pod state.", ()) in _logged_errors(log_records)
+    assert ("Failed to retrieve pods from RunPod API: %s", (error,)) in _logged_errors(log_records)
 
     mock_api_client.create_pod.assert_not_called()
     mock_api_client.resume_pod.assert_not_called()
@@ -540,14 +725,13 @@ def test_manage_api_failure_during_find(
     assert result is None
 
 
-@patch("runpod_singleton.singleton.time.sleep", return_value=None) # Mock time.sleep
 def test_manage_no_pod_creation_retry_succeeds_same_gpu(
-    mock_sleep, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: dict[str, Any], mock_logger: MagicMock
+    mock_sleep: MagicMock, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, gpu_types: tuple[str, ...]
 ):
     """Test manage() retries creation on the same GPU and succeeds."""
     # Configure retries
     pod_lifecycle_manager.create_retries = 2
-    gpu_type_1 = sample_config[const.GPU_TYPES][0]
+    gpu_type_1 = gpu_types[0]
 
     mock_api_client.get_pods.return_value = [] # No existing pods
 
@@ -566,13 +750,40 @@ def test_manage_no_pod_creation_retry_succeeds_same_gpu(
     mock_api_client.get_pods.assert_called_once()
     assert mock_create_attempt.call_count == 2
     mock_create_attempt.assert_has_calls([call(gpu_type_1), call(gpu_type_1)])
-    mock_validate.assert_called_once_with(created_pod_id)
-    mock_sleep.assert_called_once_with(pod_lifecycle_manager.create_wait)
+    mock_validate.assert_called_once_with(created_pod_id, None)
+    mock_sleep.assert_called_once()
+    delay = mock_sleep.call_args.args[0]
+    assert pod_lifecycle_manager.create_wait <= delay <= pod_lifecycle_manager.create_wait * 1.1
     assert result == created_pod_id
 
 
+def test_create_with_retries_backs_off_exponentially(
+    mock_sleep: MagicMock, pod_lifecycle_manager: PodLifecycleManager
+):
+    """Test the wait between creation retries grows by 1.5x per attempt up to the cap."""
+    pod_lifecycle_manager.create_retries = 5
+    pod_lifecycle_manager.create_wait = 10
+    pod_lifecycle_manager.create_max_wait = 20
+    pod_lifecycle_manager._create_and_validate_pod_with_gpu = MagicMock(return_value=None)
+
+    with patch("runpod_singleton.singleton.random.uniform", return_value=0):
+        result = pod_lifecycle_manager._create_with_retries("gpu_id")
+
+    assert result is None
+    assert mock_sleep.call_args_list == [call(10), call(15), call(20), call(20)]
+
+
+def test_backoff_wait_jitter_bounds(pod_lifecycle_manager: PodLifecycleManager):
+    """Test _backoff_wait adds at most the configured fraction of jitter."""
+    pod_lifecycle_manager.create_wait = 10
+    pod_lifecycle_manager.create_max_wait = 100
+
+    with patch("runpod_singleton.singleton.random.uniform", side_effect=lambda a, b: b):
+        assert pod_lifecycle_manager._backoff_wait(2) == pytest.approx(15 * 1.1)
+
+
 def test_manage_no_pod_empty_gpu_types_fails(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
     """Test manage() fails correctly if gpu_types list is empty."""
     pod_lifecycle_manager.gpu_types = [] # Override config
@@ -581,81 +792,266 @@ def test_manage_no_pod_empty_gpu_types_fails(
     result = pod_lifecycle_manager.manage()
 
     mock_api_client.get_pods.assert_called_once()
-    mock_logger.error.assert_called_once_with(
-        "No GPU types specified in configuration. Cannot create pod."
-    )
+    assert _logged_errors(log_records) == [
+        ("No GPU types specified in configuration. Cannot create pod.", ())
+    ]
     mock_api_client.create_pod.assert_not_called()
     assert result is None
 
 
-# --- perform_cleanup_actions() Tests ---
+def test_manage_parallel_creation_takes_first_success(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: Mapping[str, Any], gpu_types: tuple[str, ...]
+):
+    """Test manage() with create_parallelism tries GPU types concurrently and keeps the success."""
+    gpu_type_1, gpu_type_2 = gpu_types
+    pod_lifecycle_manager.create_parallelism = 2
+    mock_api_client.get_pods.return_value = []
+    created_pod_id = "new_pod_id_2"
 
-def test_perform_cleanup_no_flags(
+    def create_side_effect(**kwargs: Any) -> dict[str, Any]:
+        if kwargs["gpu_type_id"] == gpu_type_1:
+            raise RunpodApiError("GPU unavailable")
+        return {"id": created_pod_id}
+
+    mock_api_client.create_pod.side_effect = create_side_effect
+    mock_api_client.get_pod.return_value = {
+        const.POD_ID: created_pod_id,
+        const.POD_NAME_API: sample_config[const.POD_NAME],
+        const.POD_STATUS: const.POD_STATUS_RUNNING,
+    }
+
+    result = pod_lifecycle_manager.manage()
+
+    assert {c.kwargs["gpu_type_id"] for c in mock_api_client.create_pod.call_args_list} == {gpu_type_1, gpu_type_2}
+    mock_api_client.terminate_pod.assert_not_called()
+    assert result == created_pod_id
+
+
+def test_manage_parallel_creation_terminates_surplus_pods(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: Mapping[str, Any], gpu_types: tuple[str, ...]
+):
+    """Test manage() with create_parallelism terminates pods created after the first success."""
+    pod_lifecycle_manager.create_parallelism = 2
+    mock_api_client.get_pods.return_value = []
+    barrier = threading.Barrier(2, timeout=1)
+
+    def create_side_effect(**kwargs: Any) -> dict[str, Any]:
+        # Both creations are in flight before either one can succeed
+        barrier.wait()
+        return {"id": f"pod-{kwargs['gpu_type_id']}"}
+
+    mock_api_client.create_pod.side_effect = create_side_effect
+    mock_api_client.get_pod.side_effect = lambda pod_id: {
+        const.POD_ID: pod_id,
+        const.POD_NAME_API: sample_config[const.POD_NAME],
+        const.POD_STATUS: const.POD_STATUS_RUNNING,
+    }
+
+    result = pod_lifecycle_manager.manage()
+
+    created_ids = {f"pod-{gpu_type}" for gpu_type in gpu_types}
+    assert result in created_ids
+    mock_api_client.terminate_pod.assert_called_once_with((created_ids - {result}).pop())
+
+
+def test_manage_parallel_creation_falls_back_to_next_window(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, sample_config: Mapping[str, Any], gpu_types: tuple[str, ...]
+):
+    """Test manage() only tries the next window of GPU types after the current one fails."""
+    gpu_type_1, gpu_type_2 = gpu_types
+    pod_lifecycle_manager.gpu_types = [gpu_type_1, gpu_type_2, "NVIDIA A40"]
+    pod_lifecycle_manager.create_parallelism = 2
+    mock_api_client.get_pods.return_value = []
+    created_pod_id = "new_pod_id_3"
+
+    def create_side_effect(**kwargs: Any) -> dict[str, Any]:
+        if kwargs["gpu_type_id"] != "NVIDIA A40":
+            raise RunpodApiError("GPU unavailable")
+        return {"id": created_pod_id}
+
+    mock_api_client.create_pod.side_effect = create_side_effect
+    mock_api_client.get_pod.return_value = {
+        const.POD_ID: created_pod_id,
+        const.POD_NAME_API: sample_config[const.POD_NAME],
+        const.POD_STATUS: const.POD_STATUS_RUNNING,
+    }
+
+    result = pod_lifecycle_manager.manage()
+
+    gpu_type_ids = [c.kwargs["gpu_type_id"] for c in mock_api_client.create_pod.call_args_list]
+    assert set(gpu_type_ids[:2]) == {gpu_type_1, gpu_type_2}
+    assert gpu_type_ids[2] == "NVIDIA A40"
+    assert result == created_pod_id
+
+
+def test_create_with_retries_cancelled_during_backoff(
+    mock_sleep: MagicMock, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test a cancelled creation worker stops waiting for its next attempt."""
+    pod_lifecycle_manager.create_retries = 3
+    pod_lifecycle_manager.create_wait = 60
+    cancelled = threading.Event()
+
+    def create_side_effect(**kwargs: Any) -> dict[str, Any]:
+        cancelled.set()
+        raise RunpodApiError("GPU unavailable")
+
+    mock_api_client.create_pod.side_effect = create_side_effect
+
+    result = pod_lifecycle_manager._create_with_retries("gpu_id", cancelled)
+
+    assert result is None
+    mock_api_client.create_pod.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_create_with_retries_cancelled_before_validation(
     pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
 ):
-    """Test cleanup does nothing if no flags are set."""
-    # Setup manager with stop=False, terminate=False (default fixture)
-    mock_api_client.get_pods.return_value = [RUNNING_POD, MATCHING_STOPPED_POD_2]
-    result = pod_lifecycle_manager.perform_cleanup_actions()
-    mock_api_client.get_pods.assert_called_once() # Still checks for pods
-    mock_api_client.stop_pod.assert_not_called()
-    mock_api_client.terminate_pod.assert_not_called()
-    assert result is True # Cleanup itself didn't fail
+    """Test a pod created after cancellation is terminated without being polled."""
+    cancelled = threading.Event()
+
+    def create_side_effect(**kwargs: Any) -> dict[str, Any]:
+        cancelled.set()
+        return {"id": POD_ID_1}
+
+    mock_api_client.create_pod.side_effect = create_side_effect
 
+    result = pod_lifecycle_manager._create_with_retries("gpu_id", cancelled)
+
+    assert result is None
+    mock_api_client.get_pod.assert_not_called()
+    mock_api_client.terminate_pod.assert_called_once_with(POD_ID_1)
 
-def test_perform_cleanup_stop_flag(
-    pod_lifecycle_manager_stop: PodLifecycleManager, mock_api_client: MagicMock
+
+def test_create_with_retries_cancelled_during_validation(
+    mock_sleep: MagicMock, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
 ):
-    """Test cleanup stops only running matching pods with stop=True."""
-    mock_api_client.get_pods.return_value = [RUNNING_POD, MATCHING_STOPPED_POD_2, OTHER_RUNNING_POD]
-    result = pod_lifecycle_manager_stop.perform_cleanup_actions()
-    mock_api_client.get_pods.assert_called_once()
-    mock_api_client.stop_pod.assert_called_once_with(RUNNING_POD[const.POD_ID]) # Only the running one
+    """Test a pod still starting when its window is cancelled stops polling and is terminated."""
+    cancelled = threading.Event()
+    mock_api_client.create_pod.return_value = {"id": POD_ID_1}
+
+    def get_pod_side_effect(pod_id: str) -> dict[str, Any]:
+        cancelled.set()
+        return {**RUNNING_POD, const.POD_STATUS: "CREATED"}
+
+    mock_api_client.get_pod.side_effect = get_pod_side_effect
+
+    result = pod_lifecycle_manager._create_with_retries("gpu_id", cancelled)
+
+    assert result is None
+    mock_api_client.get_pod.assert_called_once_with(POD_ID_1)
+    mock_sleep.assert_not_called()
+    mock_api_client.terminate_pod.assert_called_once_with(POD_ID_1)
+
+
+def test_validate_new_pod_polls_until_running(
+    mock_sleep: MagicMock, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test _validate_new_pod polls with backoff until the pod reports RUNNING."""
+    mock_api_client.get_pod.side_effect = [
+        {**RUNNING_POD, const.POD_STATUS: "CREATED"},
+        {**RUNNING_POD, const.POD_STATUS: "CREATED"},
+        RUNNING_POD,
+    ]
+
+    result = pod_lifecycle_manager._validate_new_pod(POD_ID_1)
+
+    assert mock_api_client.get_pod.call_count == 3
+    mock_sleep.assert_has_calls([
+        call(pod_lifecycle_manager.validate_poll_initial),
+        call(pod_lifecycle_manager.validate_poll_initial * const.VALIDATE_POLL_BACKOFF_FACTOR),
+    ])
     mock_api_client.terminate_pod.assert_not_called()
     assert result is True
 
 
-def test_perform_cleanup_terminate_flag(
-    pod_lifecycle_manager_terminate: PodLifecycleManager, mock_api_client: MagicMock
+def test_validate_resumed_pod_gives_up_after_timeout(
+    mock_sleep: MagicMock, fake_clock: _FakeClock, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
 ):
-    """Test cleanup terminates all matching pods with terminate=True."""
-    mock_api_client.get_pods.return_value = [RUNNING_POD, MATCHING_STOPPED_POD_2, OTHER_RUNNING_POD]
-    result = pod_lifecycle_manager_terminate.perform_cleanup_actions()
-    mock_api_client.get_pods.assert_called_once()
+    """Test _validate_resumed_pod stops polling once the wait budget is spent."""
+    pod_lifecycle_manager.validate_poll_timeout = 3
+    pod_lifecycle_manager.validate_poll_initial = 1
+    mock_api_client.get_pod.return_value = STOPPED_POD
+
+    result = pod_lifecycle_manager._validate_resumed_pod(POD_ID_1)
+
+    # Waits 1s, then 2s, then the 3s budget is exhausted
+    assert mock_api_client.get_pod.call_count == 3
+    mock_sleep.assert_has_calls([call(1), call(2)])
+    assert mock_sleep.call_count == 2
+    assert result is False
+
+
+def test_poll_pod_running_counts_api_time_against_timeout(
+    mock_sleep: MagicMock, fake_clock: _FakeClock, pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test time spent in slow get_pod() calls is charged to the poll timeout."""
+    pod_lifecycle_manager.validate_poll_timeout = 3
+    pod_lifecycle_manager.validate_poll_initial = 1
+
+    def slow_get_pod(pod_id: str) -> Mapping[str, Any]:
+        fake_clock.advance(2)
+        return STOPPED_POD
+
+    mock_api_client.get_pod.side_effect = slow_get_pod
+
+    pod_details = pod_lifecycle_manager._poll_pod_running(POD_ID_1)
+
+    # 2s call, 1s wait (the rest of the budget), 2s call, then past the deadline
+    assert mock_api_client.get_pod.call_count == 2
+    assert mock_sleep.call_args_list == [call(1)]
+    assert pod_details == STOPPED_POD
+
+
+# --- perform_cleanup_actions() Tests ---
+
+def test_perform_cleanup_no_flags(
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+):
+    """Test cleanup does nothing if no flags are set."""
+    # Setup manager with stop=False, terminate=False (default fixture)
+    mock_api_client.get_pods.return_value = MATCHING_PODS
+    result = pod_lifecycle_manager.perform_cleanup_actions()
+    mock_api_client.get_pods.assert_not_called() # Nothing to do, so pods aren't listed
     mock_api_client.stop_pod.assert_not_called()
-    # Should terminate both matching pods regardless of state
-    mock_api_client.terminate_pod.assert_has_calls(
-        [call(RUNNING_POD[const.POD_ID]), call(MATCHING_STOPPED_POD_2[const.POD_ID])],
-        any_order=True
-    )
-    assert mock_api_client.terminate_pod.call_count == 2
-    assert result is True
+    mock_api_client.terminate_pod.assert_not_called()
+    assert result is True # Cleanup itself didn't fail
 
 
-def test_perform_cleanup_stop_and_terminate_flags(
-    pod_lifecycle_manager_stop_terminate: PodLifecycleManager, mock_api_client: MagicMock
+@pytest.mark.parametrize(
+    "stop, terminate, expected_stop_calls, expected_terminated_ids",
+    [
+        (True, False, [CALL_POD_1], set()), # Only the running one
+        (False, True, [], {POD_ID_1, POD_ID_2}), # All matching pods regardless of state
+        (True, True, [CALL_POD_1], {POD_ID_1, POD_ID_2}),
+    ],
+    ids=["stop", "terminate", "stop_and_terminate"],
+)
+def test_perform_cleanup_flags(
+    manager_factory: Callable[..., PodLifecycleManager],
+    mock_api_client: MagicMock,
+    stop: bool,
+    terminate: bool,
+    expected_stop_calls: list[Any],
+    expected_terminated_ids: set[str],
 ):
-    """Test cleanup stops running pods then terminates all matching pods."""
-    mock_api_client.get_pods.return_value = [RUNNING_POD, MATCHING_STOPPED_POD_2, OTHER_RUNNING_POD]
-    result = pod_lifecycle_manager_stop_terminate.perform_cleanup_actions()
+    """Test cleanup stops running matching pods and/or terminates all matching pods per the flags."""
+    mock_api_client.get_pods.return_value = ALL_PODS
+    result = manager_factory(stop=stop, terminate=terminate).perform_cleanup_actions()
     mock_api_client.get_pods.assert_called_once()
-    # Stop should be called first only on the running one
-    mock_api_client.stop_pod.assert_called_once_with(RUNNING_POD[const.POD_ID])
-    # Terminate should be called on both matching pods
-    mock_api_client.terminate_pod.assert_has_calls(
-        [call(RUNNING_POD[const.POD_ID]), call(MATCHING_STOPPED_POD_2[const.POD_ID])],
-        any_order=True
-    )
-    assert mock_api_client.terminate_pod.call_count == 2
+    assert mock_api_client.stop_pod.call_args_list == expected_stop_calls
+    assert _called_pod_ids(mock_api_client.terminate_pod) == expected_terminated_ids
+    assert mock_api_client.terminate_pod.call_count == len(expected_terminated_ids)
     assert result is True
 
 
 def test_perform_cleanup_no_matching_pods(
-    pod_lifecycle_manager_stop_terminate: PodLifecycleManager, mock_api_client: MagicMock
+    manager_factory: Callable[..., PodLifecycleManager], mock_api_client: MagicMock
 ):
     """Test cleanup does nothing if no matching pods are found."""
     mock_api_client.get_pods.return_value = [OTHER_RUNNING_POD]
-    result = pod_lifecycle_manager_stop_terminate.perform_cleanup_actions()
+    result = manager_factory(stop=True, terminate=True).perform_cleanup_actions()
     mock_api_client.get_pods.assert_called_once()
     mock_api_client.stop_pod.assert_not_called()
     mock_api_client.terminate_pod.assert_not_called()
@@ -663,64 +1059,82 @@ def test_perform_cleanup_no_matching_pods(
 
 
 def test_perform_cleanup_stop_api_error_continues(
-    pod_lifecycle_manager_stop: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    manager_factory: Callable[..., PodLifecycleManager], mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
     """Test cleanup logs error and continues if stop_pod API fails for one pod."""
-    mock_api_client.get_pods.return_value = [RUNNING_POD, MATCHING_STOPPED_POD_2]
+    mock_api_client.get_pods.return_value = MATCHING_PODS
     error_message = "Stop API unavailable"
-    mock_api_client.stop_pod.side_effect = Exception(error_message)
+    error = RunpodApiError(error_message)
+    mock_api_client.stop_pod.side_effect = error
 
-    result = pod_lifecycle_manager_stop.perform_cleanup_actions()
+    result = manager_factory(stop=True).perform_cleanup_actions()
 
     mock_api_client.get_pods.assert_called_once()
     mock_api_client.stop_pod.assert_called_once_with(RUNNING_POD[const.POD_ID])
-    mock_logger.error.assert_called_once_with(
-        f"Error stopping pod {RUNNING_POD[const.POD_ID]}: {error_message}"
-    )
+    assert _logged_errors(log_records) == [
+        ("Error %s pod %s: %s", ("stopping", RUNNING_POD[const.POD_ID], error))
+    ]
     mock_api_client.terminate_pod.assert_not_called()
     assert result is True
 
 
 def test_perform_cleanup_terminate_api_error_continues(
-    pod_lifecycle_manager_terminate: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    manager_factory: Callable[..., PodLifecycleManager], mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
     """Test cleanup logs error and continues if terminate_pod API fails for one pod."""
-    mock_api_client.get_pods.return_value = [RUNNING_POD, MATCHING_STOPPED_POD_2]
+    mock_api_client.get_pods.return_value = MATCHING_PODS
     error_message = "Terminate API unavailable"
-    mock_api_client.terminate_pod.side_effect = [Exception(error_message), MagicMock()] # Fail first, succeed second
+    error = RunpodApiError(error_message)
+
+    def terminate_side_effect(pod_id: str) -> None:
+        # Fail for the first pod, succeed for the second (calls may arrive in any order)
+        if pod_id == RUNNING_POD[const.POD_ID]:
+            raise error
 
-    result = pod_lifecycle_manager_terminate.perform_cleanup_actions()
+    mock_api_client.terminate_pod.side_effect = terminate_side_effect
+
+    result = manager_factory(terminate=True).perform_cleanup_actions()
 
     mock_api_client.get_pods.assert_called_once()
     mock_api_client.stop_pod.assert_not_called()
     assert mock_api_client.terminate_pod.call_count == 2
-    mock_api_client.terminate_pod.assert_has_calls(
-        [call(RUNNING_POD[const.POD_ID]), call(MATCHING_STOPPED_POD_2[const.POD_ID])],
-        any_order=True
-    )
-    mock_logger.error.assert_called_once_with(
-        f"Error terminating pod {RUNNING_POD[const.POD_ID]}: {error_message}"
-    )
+    assert _called_pod_ids(mock_api_client.terminate_pod) == {POD_ID_1, POD_ID_2}
+    assert _logged_errors(log_records) == [
+        ("Error %s pod %s: %s", ("terminating", RUNNING_POD[const.POD_ID], error))
+    ]
+    assert result is True
+
+
+def test_perform_cleanup_runs_actions_concurrently(
+    manager_factory: Callable[..., PodLifecycleManager], mock_api_client: MagicMock
+):
+    """Test cleanup sends terminate calls for all matching pods concurrently."""
+    mock_api_client.get_pods.return_value = MATCHING_PODS
+    barrier = threading.Barrier(2, timeout=1)
+    # Each call waits for the other, so this only completes if both run at once
+    mock_api_client.terminate_pod.side_effect = lambda pod_id: barrier.wait()
+
+    result = manager_factory(terminate=True).perform_cleanup_actions()
+
+    assert mock_api_client.terminate_pod.call_count == 2
+    assert not barrier.broken
     assert result is True
 
 
 def test_perform_cleanup_api_failure(
-    pod_lifecycle_manager_stop_terminate: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    manager_factory: Callable[..., PodLifecycleManager], mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
-    """Test cleanup returns False and logs error if find_all_pods_by_name fails."""
+    """Test cleanup returns False and logs error if find_pods_by_name_partitioned fails."""
     error_message = "API Error during cleanup find"
-    # Simulate get_pods failing when called by find_all_pods_by_name
-    mock_api_client.get_pods.side_effect = Exception(error_message)
+    # Simulate get_pods failing when called by find_pods_by_name_partitioned
+    error = RunpodApiError(error_message)
+    mock_api_client.get_pods.side_effect = error
 
-    result = pod_lifecycle_manager_stop_terminate.perform_cleanup_actions()
+    result = manager_factory(stop=True, terminate=True).perform_cleanup_actions()
 
     mock_api_client.get_pods.assert_called_once()
-    mock_logger.error.assert_any_call(
-        "API call to get pods failed. Cannot perform cleanup actions."
-    )
-    mock_logger.error.assert_any_call(
-        f"Failed to retrieve pods from RunPod API: {error_message}"
-    )
+    assert ("API call to get pods failed. Cannot perform cleanup actions.", ()) in _logged_errors(log_records)
+    assert ("Failed to retrieve pods from RunPod API: %s", (error,)) in _logged_errors(log_records)
     mock_api_client.stop_pod.assert_not_called()
     mock_api_client.terminate_pod.assert_not_called()
     assert result is None
@@ -728,59 +1142,41 @@ def test_perform_cleanup_api_failure(
 
 # --- get_pod_counts() Tests ---
 
-def test_get_pod_counts_no_pods(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
-):
-    """Test get_pod_counts returns zeros when no matching pods are found."""
-    pod_lifecycle_manager.find_all_pods_by_name = MagicMock(return_value=[]) # Mock the dependency
-    counts = pod_lifecycle_manager.get_pod_counts()
-    pod_lifecycle_manager.find_all_pods_by_name.assert_called_once()
-    assert counts == {"total": 0, "running": 0}
-
-
-def test_get_pod_counts_one_running(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
-):
-    """Test get_pod_counts correctly counts one running pod."""
-    pod_lifecycle_manager.find_all_pods_by_name = MagicMock(return_value=[RUNNING_POD])
-    counts = pod_lifecycle_manager.get_pod_counts()
-    pod_lifecycle_manager.find_all_pods_by_name.assert_called_once()
-    assert counts == {"total": 1, "running": 1}
-
-
-def test_get_pod_counts_one_stopped(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
-):
-    """Test get_pod_counts correctly counts one stopped pod."""
-    pod_lifecycle_manager.find_all_pods_by_name = MagicMock(return_value=[STOPPED_POD])
-    counts = pod_lifecycle_manager.get_pod_counts()
-    pod_lifecycle_manager.find_all_pods_by_name.assert_called_once()
-    assert counts == {"total": 1, "running": 0}
-
-
-def test_get_pod_counts_one_running_one_stopped(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock
+@pytest.mark.parametrize(
+    "matching_pods, expected_counts",
+    [
+        ((), {"total": 0, "running": 0}),
+        ((RUNNING_POD,), {"total": 1, "running": 1}),
+        ((STOPPED_POD,), {"total": 1, "running": 0}),
+        (MATCHING_PODS, {"total": 2, "running": 1}),
+    ],
+    ids=["no_pods", "one_running", "one_stopped", "one_running_one_stopped"],
+)
+def test_get_pod_counts(
+    pod_lifecycle_manager: PodLifecycleManager,
+    matching_pods: tuple[Mapping[str, Any], ...],
+    expected_counts: dict[str, int],
 ):
-    """Test get_pod_counts correctly counts a mix of running and stopped pods."""
-    # Note: find_all_pods_by_name should only return matching pods
-    pod_lifecycle_manager.find_all_pods_by_name = MagicMock(
-        return_value=[RUNNING_POD, MATCHING_STOPPED_POD_2]
+    """Test get_pod_counts correctly counts running and stopped matching pods."""
+    # Note: find_pods_by_name_partitioned should only return matching pods
+    pod_lifecycle_manager.find_pods_by_name_partitioned = MagicMock(
+        return_value=_partitioned(*matching_pods)
     )
     counts = pod_lifecycle_manager.get_pod_counts()
-    pod_lifecycle_manager.find_all_pods_by_name.assert_called_once()
-    assert counts == {"total": 2, "running": 1}
+    pod_lifecycle_manager.find_pods_by_name_partitioned.assert_called_once()
+    assert counts == expected_counts
 
 
 def test_get_pod_counts_api_failure(
-    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, mock_logger: MagicMock
+    pod_lifecycle_manager: PodLifecycleManager, mock_api_client: MagicMock, log_records: list[logging.LogRecord]
 ):
-    """Test get_pod_counts returns False when find_all_pods_by_name fails."""
-    pod_lifecycle_manager.find_all_pods_by_name = MagicMock(return_value=None)
+    """Test get_pod_counts returns False when find_pods_by_name_partitioned fails."""
+    pod_lifecycle_manager.find_pods_by_name_partitioned = MagicMock(return_value=None)
 
     counts = pod_lifecycle_manager.get_pod_counts()
 
-    pod_lifecycle_manager.find_all_pods_by_name.assert_called_once()
-    mock_logger.error.assert_called_once_with(
-        "API call to get pods failed. Cannot determine pod counts."
-    )
+    pod_lifecycle_manager.find_pods_by_name_partitioned.assert_called_once()
+    assert _logged_errors(log_records) == [
+        ("API call to get pods failed. Cannot determine pod counts.", ())
+    ]
     assert counts is None
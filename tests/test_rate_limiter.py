@@ -0,0 +1,69 @@
+import threading
+import time
+
+from runpod_singleton.rate_limiter import RateLimiter
+
+
+def test_rate_limiter_tracks_in_flight():
+    """Test acquire reserves a slot and each outcome releases it."""
+    limiter = RateLimiter(rpm=10, max_concurrency=3)
+
+    limiter.acquire()
+    limiter.acquire()
+    assert limiter.in_flight == 2
+
+    limiter.on_success()
+    limiter.on_failure()
+    assert limiter.in_flight == 0
+
+
+def test_rate_limiter_aimd_adjusts_max_in_flight():
+    """Test rate limits halve the in-flight cap and successes raise it back to the profile cap."""
+    limiter = RateLimiter(rpm=100, max_concurrency=4)
+
+    limiter.acquire()
+    limiter.on_rate_limited()
+    assert limiter.max_in_flight == 2.0
+    limiter.acquire()
+    limiter.on_rate_limited()
+    limiter.acquire()
+    limiter.on_rate_limited()
+    assert limiter.max_in_flight == 1.0
+
+    for _ in range(5):
+        limiter.acquire()
+        limiter.on_success()
+    assert limiter.max_in_flight == 4.0
+
+
+def test_rate_limiter_enforces_window_budget():
+    """Test acquire blocks once the per-window call budget is spent."""
+    window = 0.05
+    limiter = RateLimiter(rpm=2, max_concurrency=5, window_seconds=window)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+        limiter.on_success()
+
+    assert time.monotonic() - start >= window
+
+
+def test_rate_limiter_blocks_at_max_in_flight():
+    """Test acquire blocks while the in-flight cap is reached until a slot is released."""
+    limiter = RateLimiter(rpm=100, max_concurrency=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        limiter.acquire()
+        acquired.set()
+        limiter.on_success()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    limiter.on_success()
+    thread.join(timeout=1)
+    assert acquired.is_set()
@@ -1,95 +1,123 @@
 import pytest
-import os
 import logging
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-from typing import Any
+from unittest.mock import DEFAULT, create_autospec, patch, MagicMock
+from typing import Any, Callable, Iterator, Mapping
 
 from runpod_singleton.singleton import (
     RunpodSingletonManager,
     RunpodApiClient,
     PodLifecycleManager,
 )
-from runpod_singleton import constants as const
+from runpod_singleton import singleton
 
 
 # --- Fixtures ---
 
-@pytest.fixture
-def mock_config_path() -> MagicMock:
-    """Fixture for a mocked Path object for config."""
-    return MagicMock(spec=Path)
+class _RecLogger:
+    """Logger stub that records error() calls and ignores other levels."""
 
+    def __init__(self) -> None:
+        self.errors: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
 
-@pytest.fixture
-def sample_loaded_config() -> dict[str, Any]:
-    """Fixture for a sample configuration dictionary returned by load_config."""
-    return {
-        const.POD_NAME: "test-singleton-pod",
-        const.IMAGE_NAME: "test-image",
-        const.GPU_TYPES: ["NVIDIA GeForce RTX 3090"],
-    }
+    def error(self, *args: Any, **kwargs: Any) -> None:
+        self.errors.append((args, kwargs))
 
+    def debug(self, *args: Any, **kwargs: Any) -> None:
+        pass
 
-@pytest.fixture
-def mock_logger_instance() -> MagicMock:
-    """Fixture for a mocked Logger instance."""
-    return MagicMock(spec=logging.Logger)
+    info = warning = debug
 
 
 @pytest.fixture
-def mock_api_client_instance() -> MagicMock:
-    """Fixture for a mocked RunpodApiClient instance."""
-    return MagicMock(spec=RunpodApiClient)
+def mock_logger_instance() -> _RecLogger:
+    """Fixture for a recording logger stub."""
+    return _RecLogger()
 
 
 @pytest.fixture
 def mock_pod_lifecycle_manager_instance() -> MagicMock:
-    """Fixture for a mocked PodLifecycleManager instance."""
-    return MagicMock(spec=PodLifecycleManager)
+    """Fixture for a mocked PodLifecycleManager instance that rejects unknown attributes."""
+    return MagicMock(spec_set=PodLifecycleManager)
+
+
+@pytest.fixture(scope="module")
+def dependency_mocks() -> Iterator[dict[str, MagicMock]]:
+    """
+    Module-scoped fixture patching RunpodSingletonManager's dependencies once,
+    so the spec_set autospecs are built a single time for all tests in this module.
+    """
+    mocks = {
+        name: create_autospec(getattr(singleton, name), spec_set=True)
+        for name in ("load_config", "Logger", "RunpodApiClient", "PodLifecycleManager")
+    }
+    patchers = [patch.object(singleton, name, new=mock) for name, mock in mocks.items()]
+    for patcher in patchers:
+        patcher.start()
+    yield mocks
+    for patcher in patchers:
+        patcher.stop()
 
 
 @pytest.fixture(autouse=True)
-def mock_dependencies():
-    """Auto-used fixture to mock dependencies for RunpodSingletonManager tests."""
-    with patch("runpod_singleton.singleton.load_config", autospec=True) as mock_load, \
-         patch("runpod_singleton.singleton.Logger", autospec=True) as mock_logger_class, \
-         patch("runpod_singleton.singleton.RunpodApiClient", autospec=True) as mock_api_client_class, \
-         patch("runpod_singleton.singleton.PodLifecycleManager", autospec=True) as mock_plm_class, \
-         patch.dict(os.environ, {}, clear=True): # Clear environment variables
-        # Configure mocks to return specific instances when called
-        mock_logger_class.return_value = MagicMock(spec=logging.Logger)
-        mock_api_client_class.return_value = MagicMock(spec=RunpodApiClient)
-        mock_plm_class.return_value = MagicMock(spec=PodLifecycleManager)
-        yield {
-            "load_config": mock_load,
-            "Logger": mock_logger_class,
-            "RunpodApiClient": mock_api_client_class,
-            "PodLifecycleManager": mock_plm_class,
-        }
+def mock_dependencies(
+    monkeypatch: pytest.MonkeyPatch, dependency_mocks: dict[str, MagicMock]
+) -> dict[str, MagicMock]:
+    """Auto-used fixture resetting the dependency mocks for each RunpodSingletonManager test."""
+    for mock in dependency_mocks.values():
+        mock.reset_mock()
+        mock.side_effect = None
+    # Configure mocks to return specific instances when called
+    dependency_mocks["load_config"].return_value = DEFAULT
+    dependency_mocks["Logger"].return_value = MagicMock(spec_set=logging.Logger)
+    dependency_mocks["RunpodApiClient"].return_value = MagicMock(spec_set=RunpodApiClient)
+    dependency_mocks["PodLifecycleManager"].return_value = MagicMock(spec_set=PodLifecycleManager)
+    # Keep a real RUNPOD_API_KEY from leaking into the environment lookup tests
+    monkeypatch.delenv("RUNPOD_API_KEY", raising=False)
+    return dependency_mocks
+
+
+@pytest.fixture
+def make_manager(
+    mock_dependencies: dict[str, MagicMock],
+    mock_config_path: object,
+    sample_config: Mapping[str, Any],
+    mock_pod_lifecycle_manager_instance: MagicMock,
+) -> Callable[..., RunpodSingletonManager]:
+    """
+    Fixture returning a factory for RunpodSingletonManager instances wired to
+    `sample_config` and `mock_pod_lifecycle_manager_instance`.
+
+    Keyword arguments are passed to the constructor; `api_key` defaults to a
+    test key, so pass `api_key=None` to exercise environment lookup.
+    """
+    mock_dependencies["load_config"].return_value = sample_config
+    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
+
+    def _make(**kwargs: Any) -> RunpodSingletonManager:
+        kwargs.setdefault("api_key", "test_key")
+        return RunpodSingletonManager(config_path=mock_config_path, **kwargs)
+    return _make
 
 
 # --- Test Cases ---
 
 def test_init_success_api_key_arg(
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
+    mock_config_path: object,
+    sample_config: Mapping[str, Any],
 ):
     """Test successful initialization with API key from argument."""
     api_key = "arg_api_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
 
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key, debug=True
-    )
+    manager = make_manager(api_key=api_key, debug=True)
 
     mock_dependencies["Logger"].assert_called_once_with(
         "RunpodSingletonManager", debug=True
     )
     mock_dependencies["load_config"].assert_called_once_with(mock_config_path)
-    mock_dependencies["RunpodApiClient"].assert_called_once_with(api_key=api_key)
-    assert manager.config is sample_loaded_config
+    mock_dependencies["RunpodApiClient"].assert_called_once_with(api_key=api_key, pods_file_cache_ttl=0.0)
+    assert manager.config is sample_config
     assert manager.log is mock_dependencies["Logger"].return_value
     assert manager.client is mock_dependencies["RunpodApiClient"].return_value
     assert manager.stop is False
@@ -97,25 +125,23 @@ def test_init_success_api_key_arg(
     assert manager.debug is True
 
 
-@patch.dict(os.environ, {"RUNPOD_API_KEY": "env_api_key"}, clear=True)
 def test_init_success_api_key_env(
+    monkeypatch: pytest.MonkeyPatch,
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
+    mock_config_path: object,
+    sample_config: Mapping[str, Any],
 ):
     """Test successful initialization with API key from environment."""
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, stop=True, terminate=True
-    )
+    monkeypatch.setenv("RUNPOD_API_KEY", "env_api_key")
+    manager = make_manager(api_key=None, stop=True, terminate=True)
 
     mock_dependencies["Logger"].assert_called_once_with(
         "RunpodSingletonManager", debug=False
     )
     mock_dependencies["load_config"].assert_called_once_with(mock_config_path)
-    mock_dependencies["RunpodApiClient"].assert_called_once_with(api_key="env_api_key")
-    assert manager.config is sample_loaded_config
+    mock_dependencies["RunpodApiClient"].assert_called_once_with(api_key="env_api_key", pods_file_cache_ttl=0.0)
+    assert manager.config is sample_config
     assert manager.log is mock_dependencies["Logger"].return_value
     assert manager.client is mock_dependencies["RunpodApiClient"].return_value
     assert manager.stop is True
@@ -124,197 +150,116 @@ def test_init_success_api_key_env(
 
 
 def test_init_api_key_precedence(
+    monkeypatch: pytest.MonkeyPatch,
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
 ):
     """Test API key argument takes precedence over environment variable."""
+    monkeypatch.setenv("RUNPOD_API_KEY", "env_api_key")
     api_key_arg = "arg_api_key"
-    with patch.dict(os.environ, {"RUNPOD_API_KEY": "env_api_key"}, clear=True):
-        mock_dependencies["load_config"].return_value = sample_loaded_config
-        manager = RunpodSingletonManager(
-            config_path=mock_config_path, api_key=api_key_arg
-        )
-        mock_dependencies["RunpodApiClient"].assert_called_once_with(api_key=api_key_arg)
+    make_manager(api_key=api_key_arg)
+    mock_dependencies["RunpodApiClient"].assert_called_once_with(api_key=api_key_arg, pods_file_cache_ttl=0.0)
 
 
-def test_init_no_api_key_raises_error(
-    mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
-):
+def test_init_no_api_key_raises_error(make_manager: Callable[..., RunpodSingletonManager]):
     """Test initialization raises RuntimeError if no API key is found."""
     # No arg, no env var
-    mock_dependencies["load_config"].return_value = sample_loaded_config
     with pytest.raises(RuntimeError, match="RunPod API key not found"):
-        RunpodSingletonManager(config_path=mock_config_path, api_key=None)
+        make_manager(api_key=None)
 
 
 def test_init_load_config_error(
-    mock_dependencies: dict[str, MagicMock], mock_config_path: MagicMock
+    mock_dependencies: dict[str, MagicMock], make_manager: Callable[..., RunpodSingletonManager]
 ):
     """Test initialization propagates exceptions from load_config."""
     mock_dependencies["load_config"].side_effect = FileNotFoundError("File not found")
     with pytest.raises(FileNotFoundError):
-        RunpodSingletonManager(config_path=mock_config_path, api_key="dummy_key")
+        make_manager()
 
 
 # --- run() Method Tests ---
 
-def test_run_calls_manage_when_no_flags(
-    mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
-    mock_pod_lifecycle_manager_instance: MagicMock,
-):
-    """Test run() calls PodLifecycleManager.manage() when stop/terminate are False."""
-    api_key = "test_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-    api_key = "test_key"
-    expected_pod_id = "pod-123-success"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
-    mock_pod_lifecycle_manager_instance.manage.return_value = expected_pod_id
-
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key, stop=False, terminate=False
-    )
-    result = manager.run()
-
-    mock_dependencies["PodLifecycleManager"].assert_called_once_with(
-        manager.client, manager.config, manager.log, False, False
-    )
-    mock_pod_lifecycle_manager_instance.manage.assert_called_once()
-    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_not_called()
-    assert result == expected_pod_id
-
-
-def test_run_calls_cleanup_when_stop_flag(
-    mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
-    mock_pod_lifecycle_manager_instance: MagicMock,
-):
-    """Test run() calls PodLifecycleManager.perform_cleanup_actions() when stop=True."""
-    api_key = "test_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
-    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.return_value = True # Simulate success
-
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key, stop=True, terminate=False
-    )
-    result = manager.run()
-
-    mock_dependencies["PodLifecycleManager"].assert_called_once_with(
-        manager.client, manager.config, manager.log, True, False
-    )
-    mock_pod_lifecycle_manager_instance.manage.assert_not_called()
-    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_called_once()
-    assert result is True
-
-
-def test_run_calls_cleanup_when_terminate_flag(
-    mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
-    mock_pod_lifecycle_manager_instance: MagicMock,
-):
-    """Test run() calls PodLifecycleManager.perform_cleanup_actions() when terminate=True."""
-    api_key = "test_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
-    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.return_value = None
-
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key, stop=False, terminate=True
-    )
-    result = manager.run()
-
-    mock_dependencies["PodLifecycleManager"].assert_called_once_with(
-        manager.client, manager.config, manager.log, False, True
-    )
-    mock_pod_lifecycle_manager_instance.manage.assert_not_called()
-    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_called_once()
-    assert result is None
-
-
-def test_run_calls_cleanup_when_both_flags(
+@pytest.mark.parametrize(
+    "stop, terminate, expect_manage, expected_result",
+    [
+        (False, False, True, "pod-123-success"),
+        (True, False, False, True),
+        (False, True, False, None),
+        (True, True, False, True),
+    ],
+    ids=["no_flags", "stop", "terminate", "stop_and_terminate"],
+)
+def test_run_dispatches_on_flags(
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
     mock_pod_lifecycle_manager_instance: MagicMock,
+    stop: bool,
+    terminate: bool,
+    expect_manage: bool,
+    expected_result: str | bool | None,
 ):
-    """Test run() calls PodLifecycleManager.perform_cleanup_actions() when stop=True and terminate=True."""
-    api_key = "test_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
-    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.return_value = True
+    """Test run() calls manage() without flags and perform_cleanup_actions() with stop/terminate."""
+    if expect_manage:
+        mock_pod_lifecycle_manager_instance.manage.return_value = expected_result
+    else:
+        mock_pod_lifecycle_manager_instance.perform_cleanup_actions.return_value = expected_result
 
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key, stop=True, terminate=True
-    )
+    manager = make_manager(stop=stop, terminate=terminate)
     result = manager.run()
 
     mock_dependencies["PodLifecycleManager"].assert_called_once_with(
-        manager.client, manager.config, manager.log, True, True
+        manager.client, manager.config, manager.log, stop, terminate
     )
-    mock_pod_lifecycle_manager_instance.manage.assert_not_called()
-    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_called_once()
-    assert result is True
+    mock_pod_lifecycle_manager_instance.set_cleanup_flags.assert_called_once_with(stop, terminate)
+    if expect_manage:
+        mock_pod_lifecycle_manager_instance.manage.assert_called_once()
+        mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_not_called()
+    else:
+        mock_pod_lifecycle_manager_instance.manage.assert_not_called()
+        mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_called_once()
+    assert result == expected_result
 
 
 def test_run_catches_exception_in_manage(
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
     mock_pod_lifecycle_manager_instance: MagicMock,
-    mock_logger_instance: MagicMock,
+    mock_logger_instance: _RecLogger,
 ):
     """Test run() catches exceptions from manage(), logs, and returns False."""
-    api_key = "test_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
     mock_dependencies["Logger"].return_value = mock_logger_instance # Use specific logger mock
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
     error_message = "Unexpected error during manage"
-    mock_pod_lifecycle_manager_instance.manage.side_effect = Exception(error_message)
+    error = Exception(error_message)
+    mock_pod_lifecycle_manager_instance.manage.side_effect = error
 
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key, stop=False, terminate=False, debug=True
-    )
+    manager = make_manager(stop=False, terminate=False, debug=True)
     result = manager.run()
 
     mock_pod_lifecycle_manager_instance.manage.assert_called_once()
-    mock_logger_instance.error.assert_called_once_with(
-        f"An unexpected error occurred during execution: {error_message}",
-        exc_info=True
-    )
+    assert mock_logger_instance.errors == [
+        (("An unexpected error occurred during execution: %s", error), {"exc_info": True})
+    ]
     assert result is None
 
 
 def test_run_catches_exception_in_cleanup(
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
     mock_pod_lifecycle_manager_instance: MagicMock,
-    mock_logger_instance: MagicMock,
+    mock_logger_instance: _RecLogger,
 ):
     """Test run() catches exceptions from perform_cleanup_actions(), logs, and returns False."""
-    api_key = "test_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
     mock_dependencies["Logger"].return_value = mock_logger_instance # Use specific logger mock
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
     error_message = "Unexpected error during cleanup"
     mock_pod_lifecycle_manager_instance.perform_cleanup_actions.side_effect = Exception(error_message)
 
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key, stop=True, terminate=False
-    )
+    manager = make_manager(stop=True, terminate=False)
     result = manager.run()
 
     mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_called_once()
-    mock_logger_instance.error.assert_called_once()
-    assert error_message in mock_logger_instance.error.call_args[0][0]
+    assert len(mock_logger_instance.errors) == 1
+    log_args, _ = mock_logger_instance.errors[0]
+    assert error_message in log_args[0] % log_args[1:]
     assert result is None
 
 
@@ -322,20 +267,14 @@ def test_run_catches_exception_in_cleanup(
 
 def test_count_pods_success(
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
     mock_pod_lifecycle_manager_instance: MagicMock,
 ):
     """Test count_pods() calls PodLifecycleManager.get_pod_counts and returns result."""
-    api_key = "test_key"
     expected_counts = {"total": 5, "running": 2}
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
     mock_pod_lifecycle_manager_instance.get_pod_counts.return_value = expected_counts
 
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key
-    )
+    manager = make_manager()
     result = manager.count_pods()
 
     mock_dependencies["PodLifecycleManager"].assert_called_once_with(
@@ -345,21 +284,40 @@ def test_count_pods_success(
     assert result == expected_counts
 
 
+def test_count_pods_and_run_share_lifecycle_manager(
+    mock_dependencies: dict[str, MagicMock],
+    make_manager: Callable[..., RunpodSingletonManager],
+    mock_pod_lifecycle_manager_instance: MagicMock,
+):
+    """Test count_pods() and run() reuse a single PodLifecycleManager."""
+    manager = make_manager()
+    manager.count_pods()
+    manager.terminate = True
+    manager.run()
+
+    mock_dependencies["PodLifecycleManager"].assert_called_once()
+    mock_pod_lifecycle_manager_instance.set_cleanup_flags.assert_called_once_with(False, True)
+    mock_pod_lifecycle_manager_instance.get_pod_counts.assert_called_once()
+    mock_pod_lifecycle_manager_instance.perform_cleanup_actions.assert_called_once()
+
+
+def test_context_manager_closes_client(make_manager: Callable[..., RunpodSingletonManager]):
+    """Test leaving the manager's context closes the API client."""
+    with make_manager() as manager:
+        manager.client.close.assert_not_called()
+
+    manager.client.close.assert_called_once()
+
+
 def test_count_pods_failure(
     mock_dependencies: dict[str, MagicMock],
-    mock_config_path: MagicMock,
-    sample_loaded_config: dict[str, Any],
+    make_manager: Callable[..., RunpodSingletonManager],
     mock_pod_lifecycle_manager_instance: MagicMock,
 ):
     """Test count_pods() returns False when get_pod_counts fails."""
-    api_key = "test_key"
-    mock_dependencies["load_config"].return_value = sample_loaded_config
-    mock_dependencies["PodLifecycleManager"].return_value = mock_pod_lifecycle_manager_instance
     mock_pod_lifecycle_manager_instance.get_pod_counts.return_value = None
 
-    manager = RunpodSingletonManager(
-        config_path=mock_config_path, api_key=api_key
-    )
+    manager = make_manager()
     result = manager.count_pods()
 
     mock_dependencies["PodLifecycleManager"].assert_called_once_with(